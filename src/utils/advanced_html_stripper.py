@@ -4,9 +4,323 @@ Implements aggressive deduplication and semantic normalization
 Target: Reduce large stripped files to minimal semantic content
 NO hardcoded plan names - all extraction uses heuristics, patterns, and HTML structure
 """
+import os
 import re
-from bs4 import BeautifulSoup, NavigableString
-from typing import Dict, Any, List, Tuple, Optional
+import html
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from bs4 import BeautifulSoup, CData, NavigableString, SoupStrainer, Tag
+import soupsieve
+from typing import Dict, Any, List, Tuple, Optional, Callable, Union
+
+# Prefer the C-based lxml parser where installed; html.parser keeps the module portable
+try:
+    import lxml  # noqa: F401
+    _FAST_HTML_PARSER = 'lxml'
+except ImportError:
+    _FAST_HTML_PARSER = 'html.parser'
+
+
+class _TagStrainer(SoupStrainer):
+    """
+    SoupStrainer driven by a plain (name, attrs) predicate
+    bs4 >= 4.13 only hands the tag name to callable name rules, so hook tag creation directly
+    """
+    
+    def __init__(self, predicate: Callable[[str, Dict[str, Any]], bool]):
+        super().__init__()
+        self.predicate = predicate
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        # bs4 >= 4.13
+        return bool(self.predicate(name, attrs or {}))
+    
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        # bs4 < 4.13 (only reached while parsing with parse_only)
+        return bool(self.predicate(markup_name, markup_attrs or {}))
+
+
+_ROGERS_TILE_TAGS = ('ds-tile', 'dsa-vertical-tile')
+
+
+def _is_rogers_tile(name: str, attrs: Dict[str, Any]) -> bool:
+    """Rogers plan tile: <ds-tile>/<dsa-vertical-tile> or any class containing ds-tile/dsa-vertical-tile"""
+    if name in _ROGERS_TILE_TAGS:
+        return True
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    return 'ds-tile' in classes or 'dsa-vertical-tile' in classes
+
+
+def _is_telus_tile_testid(value: Optional[str]) -> bool:
+    """Telus plan tile data-testid (mfe-rate-plan-tile-*-container or mfe-rate-plan-card-id-*)"""
+    return bool(value) and ('mfe-rate-plan-tile-' in value or 'mfe-rate-plan-card-id-' in value)
+
+
+def _is_telus_tile_container_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'mfe-rate-plan-tile-' in value and '-container' in value
+
+
+def _is_telus_card_id_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'mfe-rate-plan-card-id-' in value
+
+
+def _is_telus_price_lockup_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'plan-price-lockup' in value
+
+
+def _is_telus_regular_price_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'plan-price-before-discounts' in value
+
+
+def _is_telus_data_amount_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'mfe-rate-plan-data-bucket-amount' in value
+
+
+def _is_telus_data_speed_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'mfe-rate-plan-data-bucket-speed' in value
+
+
+def _is_koodo_tile_testid(value: Optional[str]) -> bool:
+    """Koodo plan group / tile data-testid (mfe-rate-plan-tile*, any case)"""
+    return bool(value) and 'mfe-rate-plan-tile' in value.lower()
+
+
+def _is_koodo_group_testid(value: Optional[str]) -> bool:
+    """Actual Koodo plan group (mfe-rate-plan-tile-group-N), not one of its containers"""
+    return bool(value) and _RE_KOODO_GROUP_ID.search(value) is not None
+
+
+def _is_koodo_group_tile_testid(value: Optional[str]) -> bool:
+    """Koodo plan tile inside a group's tiles container (mfe-rate-plan-tile*container, not a group wrapper)"""
+    return bool(value) and 'group' not in value.lower() and _RE_KOODO_TESTID_TILE_CONTAINER.search(value) is not None
+
+
+def _is_koodo_loose_tile_testid(value: Optional[str]) -> bool:
+    """Koodo plan tile container on pages without plan groups"""
+    if not value:
+        return False
+    value = value.lower()
+    return 'mfe-rate-plan-tile' in value and 'container' in value and 'group' not in value
+
+
+def _is_koodo_group_name_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'mfe-rate-plan-group-name' in value.lower()
+
+
+def _is_koodo_tiles_container_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'mfe-rate-plan-tile-group-tiles-container' in value.lower()
+
+
+def _is_koodo_allowance_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'mfe-rate-plan-allowance-description' in value.lower()
+
+
+def _is_koodo_data_amount_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'data-bucket-amount' in value.lower()
+
+
+def _is_koodo_data_speed_testid(value: Optional[str]) -> bool:
+    """data-bucket-speed, which also matches data-bucket-speedAllowance"""
+    return bool(value) and 'data-bucket-speed' in value.lower()
+
+
+def _is_koodo_speed_allowance_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'data-bucket-speedallowance' in value.lower()
+
+
+def _is_koodo_price_lockup_testid(value: Optional[str]) -> bool:
+    return bool(value) and 'plan-price-lockup' in value.lower()
+
+
+def _is_freedom_plan_card_testid(value: Optional[str]) -> bool:
+    """Freedom plan-card data-testid (plan-card-* anywhere in the value, any case)"""
+    return bool(value) and 'plan-card-' in value.lower()
+
+
+def _class_string(tag) -> str:
+    """Space-joined class attribute of tag ('' if it has none)"""
+    classes = tag.get('class')
+    if not classes:
+        return ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    return classes
+
+
+def _is_fido_title_span(tag) -> bool:
+    """Fido plan-name <span> (a class containing text-title-5, any case)"""
+    return tag.name == 'span' and 'text-title-5' in _class_string(tag).lower()
+
+
+def _is_virgin_plan_div(tag) -> bool:
+    """Virgin plan <div> (a class containing the word "plan")"""
+    return tag.name == 'div' and _RE_VIRGIN_PLAN_CLASS.search(_class_string(tag)) is not None
+
+
+def _is_virgin_data_span(tag) -> bool:
+    """Virgin data description <span> (class containing planFeatures or RP_DATA, any case)"""
+    if tag.name != 'span':
+        return False
+    classes = _class_string(tag).lower()
+    return 'planfeatures' in classes or 'rp_data' in classes
+
+
+# Rogers tile label text that is never a plan name
+_ROGERS_LABELS = frozenset({
+    'features', 'plan perks', 'get 3% cash back value with a rogers red credit card',
+    'after auto-pay', 'price before incentives', 'rogers satellite included',
+})
+
+# Telus text that is never a plan name
+_TELUS_LABELS = frozenset({'features', 'unlock these offers', 'mobility plans', 'talk & text'})
+
+# Precompiled patterns (Rogers/Telus extractors and final HTML)
+_RE_PRICE_CLASS = re.compile('price', re.I)
+_RE_DOLLAR = re.compile(r'\$\d+(?:\.\d+)?')
+_RE_PRICE_FULL = re.compile(r'\$\d+(?:\.\d+)?(?:\s*per\s*mo|\s*/mo)?', re.I)
+_RE_DATA = re.compile(r'(\d+\s*GB|Unlimited)', re.I)
+_RE_WS = re.compile(r'\s+')
+_RE_TRAILING_DIGIT = re.compile(r'\d+$')
+_RE_BULLET = re.compile(r'^\s*[•\-\*]\s*')
+_RE_PRICE_BEFORE_INCENTIVES = re.compile(r'Price before incentives', re.I)
+_RE_TELUS_PRICE = re.compile(r'\$\d+(?:\.\d+)?(?:\s+per\s+month|\s+/mo)?', re.I)
+_RE_TELUS_DATA = re.compile(r'(\d+\s*GB(?:\s+at\s+\d+G(?:\+)?\s+Speed)?|Unlimited)', re.I)
+_RE_PROMOTION_BENEFIT = re.compile(r'promotion-benefit-text')
+_RE_TELUS_PROMO_PATTERNS = (
+    re.compile(r'\d+[- ]Year.*?Lock', re.I),
+    re.compile(r'Easy Roam[^.]*', re.I),
+    re.compile(r'discount[^.]*', re.I),
+    re.compile(r'Recurring discount[^.]*', re.I),
+)
+# Discount keyword scans - one regex pass instead of one substring test per keyword
+_RE_ROGERS_DISCOUNT = re.compile(r'discount|savings|price lock|bundle|family|per line', re.I)
+_RE_TELUS_DISCOUNT = re.compile(r'discount|savings|price lock|per line|family', re.I)
+_RE_TELUS_FEATURE = re.compile(r'discount|price lock|per line|bundle|easy roam', re.I)
+_RE_PRICE_INCLUDES_SAVINGS = re.compile(r'Price includes savings', re.I)
+_RE_UNLOCK_OFFERS = re.compile(r'Unlock these offers', re.I)
+_RE_FULL_PLAN_DETAILS = re.compile(r'Full plan details', re.I)
+_TELUS_RIBBON_TEXTS = ('ONLY AT TELUS', 'MOBILITY PLAN', 'ROAMING DESTINATIONS')
+_RE_TELUS_RIBBONS = tuple(re.compile(ribbon_text, re.I) for ribbon_text in _TELUS_RIBBON_TEXTS)
+# Any of the above - lets the fused Telus div cleanup skip non-matching divs with one scan
+_RE_TELUS_CLEANUP = re.compile(
+    '|'.join(p.pattern for p in (_RE_PRICE_INCLUDES_SAVINGS, _RE_UNLOCK_OFFERS, _RE_FULL_PLAN_DETAILS) + _RE_TELUS_RIBBONS),
+    re.I
+)
+
+
+# Precompiled patterns (Bell/Freedom extractors)
+_RE_GB = re.compile(r'(\d+)\s*GB', re.I)
+_RE_BELL_PRICE = re.compile(r'\$\s*\d+(?:\.\d+)?(?:\s*/?\s*mo\.?)?')
+_RE_BELL_PRICE_CONTEXT = re.compile(r'\$\s*(\d+(?:\.\d+)?)(?:\s*/?\s*mo\.?|\s+per month)', re.I)
+_RE_DOLLAR_SPACED = re.compile(r'\$\s*\d+(?:\.\d+)?')
+_RE_MO_SUFFIX = re.compile(r'\s*/?\s*mo\.?')
+_RE_FOOTNOTE = re.compile(r'\bfootnote\b', re.I)
+_RE_TRAILING_NUMBER = re.compile(r'\s*\b\d+\s*$')
+_RE_PLAN_CARD_ID = re.compile(r'plan-card-(\d+)(gb|mb)-?(\d+g|5g\+?|4g|lte)?', re.I)
+_RE_PLAN_CARD_NAME = re.compile(r'plan-card-([^-]+(?:-[^-]+)?)', re.I)
+_RE_5G_PLUS = re.compile(r'5g\+?', re.I)
+_RE_5G = re.compile(r'5g', re.I)
+_RE_4G_LTE = re.compile(r'4g|lte', re.I)
+# Bell keyword scans - one regex pass per text instead of one substring test per keyword
+_RE_BELL_SKIP = re.compile(r'are you|select an|how would|please select|would you like|back to|change|new customer', re.I)
+# Bell feature/caption keyword classes, tested with one scan per snippet
+_BELL_NETWORK = 1
+_BELL_ROAMING = 2
+_BELL_PROMO = 4
+_BELL_DISCOUNT = 8
+_BELL_KEYWORD_FLAGS = {
+    '5g': _BELL_NETWORK, 'lte': _BELL_NETWORK, 'network': _BELL_NETWORK,
+    'roam': _BELL_ROAMING,
+    'offer': _BELL_PROMO, 'bonus': _BELL_PROMO, 'included': _BELL_PROMO, 'perplexity': _BELL_PROMO,
+    'promo': _BELL_PROMO,
+    'price lock': _BELL_PROMO | _BELL_DISCOUNT, 'credit': _BELL_PROMO | _BELL_DISCOUNT,
+    'bundle': _BELL_PROMO | _BELL_DISCOUNT,
+    'discount': _BELL_DISCOUNT, 'per line': _BELL_DISCOUNT, 'savings': _BELL_DISCOUNT,
+    'autopay': _BELL_DISCOUNT,
+}
+# One capture group per keyword inside a lookahead, so overlapping keywords are all seen
+# (no keyword is a prefix of another, so at most one matches at each position)
+_RE_BELL_KEYWORD = re.compile(
+    '(?=' + '|'.join(f'({re.escape(keyword)})' for keyword in _BELL_KEYWORD_FLAGS) + ')', re.I
+)
+_BELL_KEYWORD_GROUP_FLAGS = (0,) + tuple(_BELL_KEYWORD_FLAGS.values())
+_RE_FREEDOM_PRICE = re.compile(r'\$?(\d+(?:\.\d+)?)\s*(?:/|per)\s*mo(?:nth)?', re.I)
+# Freedom section headings that are never a plan name
+_FREEDOM_SECTION_HEADINGS = frozenset({'features', 'promotions', 'roaming'})
+_BELL_FEATURE_LI_SELECTOR = soupsieve.compile('.g-card-plan__features li')
+_BELL_CAPTION_SELECTOR = soupsieve.compile('.g-card-plan__caption')
+
+# Koodo data-testid lookups
+_RE_KOODO_GROUP_ID = re.compile(r'mfe-rate-plan-tile-group-\d+$')
+_RE_KOODO_TESTID_TILE_CONTAINER = re.compile('mfe-rate-plan-tile.*container', re.I)
+# Koodo/Fido text patterns
+_RE_KOODO_SPEED = re.compile(r'at\s+(\d+G(?:\+)?)\s+Speed', re.I)
+_RE_KOODO_DATA = re.compile(r'(\d+)\s*GB(?:\s+at\s+\d+G(?:\+)?\s+Speed)?', re.I)
+_RE_DOLLAR_AMOUNT = re.compile(r'\$(\d+(?:\.\d+)?)')
+# Glued-word boundaries: after "<digits>GB" before a letter ("10GBof"), or lower->upper ("CanadaWide")
+_RE_GLUED_WORD_BOUNDARY = re.compile(r'(?<=\d(?i:GB))(?=(?i:[A-Za-z]))|(?<=[a-z])(?=[A-Z])')
+_RE_LEADING_GB = re.compile(r'^\d+\s*GB', re.I)
+_RE_FIDO_PRICE_CLASS = re.compile('ds-price', re.I)
+_FIDO_CONTAINER_TAGS = frozenset({'div', 'article', 'section'})
+_RE_FIDO_MONTHLY_PRICE = re.compile(r'\$(\d+(?:\.\d+)?)\s*(?:per\s*mo|/mo)', re.I)
+
+# Virgin heading text that is never a plan name (case-insensitive substrings, one regex pass)
+_RE_VIRGIN_HEADING_SKIP = re.compile('|'.join(re.escape(skip) for skip in (
+    'Warning', 'Get', 'Affordable', 'Find', 'Data, Talk and Text',
+    'All plans include', 'All plans', 'Plans include', 'New activations only',
+    'Internet Members', 'Members only',
+)), re.I)
+# Virgin feature text that is never a feature (lowercase substrings)
+_VIRGIN_FEATURE_SKIP_TEXTS = ('new activations only', 'tooltip', 'view rates', 'suspicious call detection')
+_VIRGIN_TALK_TEXT_AMOUNTS = frozenset({'pay per use', 'talk and text only'})
+# Virgin patterns
+_RE_VIRGIN_PLAN_CLASS = re.compile(r'\bplan\b')
+_RE_VIRGIN_MONTHLY_PRICE_ID = re.compile(r'accss-monthlyPrice-', re.I)
+_RE_VIRGIN_PRICE_HINT = re.compile(r'\$\d+')
+_RE_VIRGIN_MONTHLY_PRICE = re.compile(r'\$(\d+(?:\.\d+)?)\s*(?:/|per)\s*mo', re.I)
+_RE_VIRGIN_DATA = re.compile(r'(\d+)\s*(GB|MB)', re.I)
+_RE_VIRGIN_DATA_NAME = re.compile(r'(\d+GB|\d+MB)', re.I)
+_RE_VIRGIN_TALK_AND_TEXT = re.compile(r'talk\s*and\s*text', re.I)
+_RE_VIRGIN_PAY_PER_USE = re.compile(r'pay\s*per\s*use', re.I)
+_RE_VIRGIN_PAY_OR_TALK = re.compile(r'(pay\s*per\s*use|talk\s*and\s*text)', re.I)
+_RE_VIRGIN_TALK_OR_BASIC = re.compile(r'(talk\s*and\s*text|basic)', re.I)
+_RE_VIRGIN_DATA_TALK_TEXT_NAME = re.compile(r'(\d+GB)\s+data[,\s]+talk\s*[&,]\s*text', re.I)
+_RE_VIRGIN_LEADING_TALK_AND_TEXT = re.compile(r'^talk\s*and\s*text', re.I)
+_RE_VIRGIN_BASIC = re.compile(r'\bbasic\b', re.I)
+_RE_VIRGIN_PRICE_FEATURE = re.compile(r'^\$?\d+.*mo', re.I)
+_RE_VIRGIN_FEATURE_SPLIT = re.compile(r'\s{3,}|\.\s+(?=[A-Z])')  # 3+ spaces or sentence boundaries
+_RE_LEADING_AMOUNT = re.compile(r'^\$?\d+')
+# Virgin fallback feature patterns, tried in order on the container text
+_VIRGIN_FEATURE_PATTERNS = tuple(re.compile(pattern, re.I) for pattern in (
+    r'Unlimited\s+[^.]*?',
+    r'\d+\s*GB[^.]*?',
+    r'Canada-wide[^.]*?',
+    r'Text[^.]*?',
+))
+# Freedom/Fido/Virgin plan-name fallback headings
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+
+# Comments and <script>/<style>/<noscript> blocks never carry plan data - dropped before full-document parses
+_RE_NON_CONTENT_BLOCK = re.compile(r'<!--(?:-?>|.*?-->)|<(script|style|noscript)(?=[\s/>])[^>]*>.*?</\1\s*>', re.I | re.S)
+
+# Parse only plan tile subtrees - nav, scripts, footers etc. are never materialized
+_ROGERS_STRAINER = _TagStrainer(_is_rogers_tile)
+_TELUS_STRAINER = SoupStrainer(attrs={'data-testid': _is_telus_tile_testid})
+_BELL_STRAINER = SoupStrainer(attrs={'data-product-id': True})
+_FREEDOM_STRAINER = SoupStrainer(attrs={'data-testid': 'planComponent'})
+_KOODO_STRAINER = SoupStrainer(attrs={'data-testid': _is_koodo_tile_testid})
+_VIRGIN_STRAINER = SoupStrainer('plan-container')
+
+# Raw-markup markers every plan tile carries - pages without them skip the strained parse
+_RE_ROGERS_TILE_MARKER = re.compile(r'ds-tile|dsa-vertical-tile', re.I)
+_TELUS_TILE_MARKER = 'mfe-rate-plan-'
+_RE_BELL_CONTAINER_MARKER = re.compile(r'data-product-id', re.I)
+_RE_KOODO_TILE_MARKER = re.compile(r'mfe-rate-plan-tile', re.I)
+_FREEDOM_CONTAINER_MARKER = 'planComponent'
+_RE_VIRGIN_PLAN_CONTAINER_MARKER = re.compile(r'<plan-container', re.I)
 
 
 class AdvancedHTMLStripper:
@@ -15,7 +329,7 @@ class AdvancedHTMLStripper:
     """
     
     @staticmethod
-    def strip_rogers_html(html_content: str) -> Dict[str, Any]:
+    def strip_rogers_html(html_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Apply all advanced stripping rules to Rogers HTML
         
@@ -28,16 +342,18 @@ class AdvancedHTMLStripper:
         6. Normalize feature lists (flatten nested structure)
         7. Output minimal JSON-ready HTML
         """
+        html_content = AdvancedHTMLStripper._decode_html(html_content)
         original_size = len(html_content)
         original_tokens = original_size // 4
         
         print("  🔍 Advanced stripping: Deduplication + semantic normalization...")
         
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
         # Step 1: Find all plan tiles/cards
-        plan_tiles = soup.select('[class*="dsa-vertical-tile"], [class*="ds-tile"], ds-tile, dsa-vertical-tile')
+        plan_tiles = []
+        if _RE_ROGERS_TILE_MARKER.search(html_content):
+            # Parse HTML (plan tiles only)
+            soup = BeautifulSoup(html_content, _FAST_HTML_PARSER, parse_only=_ROGERS_STRAINER)
+            plan_tiles = soup.find_all(lambda tag: _is_rogers_tile(tag.name, tag.attrs))
         
         if not plan_tiles:
             print("  ⚠️  No plan tiles found, falling back to basic stripping")
@@ -52,7 +368,9 @@ class AdvancedHTMLStripper:
         # Step 3: Normalize each plan
         normalized_plans = []
         for plan_data in unique_plans:
-            normalized = AdvancedHTMLStripper._normalize_plan(plan_data['tile'])
+            normalized = AdvancedHTMLStripper._normalize_plan(
+                plan_data['tile'], plan_name=plan_data['name'], data_amount=plan_data['data']
+            )
             if normalized:
                 normalized_plans.append(normalized)
         
@@ -88,36 +406,22 @@ class AdvancedHTMLStripper:
         Deduplicate plan tiles by creating keys from (name, price, data)
         Returns list of unique plan data dictionaries
         """
-        seen_keys = {}
+        seen_keys = set()
+        seen_hashes = set()
         unique_plans = []
         
         for tile in plan_tiles:
+            # Drop copies of an earlier tile that differ only by footnotes/whitespace
+            # (e.g. desktop + mobile variants) before any per-tile extraction
+            fingerprint = AdvancedHTMLStripper._tile_fingerprint(tile)
+            tile_hash = hashlib.sha1(fingerprint.encode('utf-8')).digest()
+            if tile_hash in seen_hashes:
+                continue
+            seen_hashes.add(tile_hash)
+            
             # Extract plan_name = first meaningful <p> inside the tile
             # Plan names are: Essentials, Popular, Ultimate, etc.
-            plan_name = None
-            for p in tile.find_all('p'):
-                text = p.get_text(strip=True)
-                # Skip if empty or too short
-                if not text or len(text) < 2:
-                    continue
-                # Skip known label text
-                if text.lower() in ['features', 'plan perks', 'get 3% cash back value with a rogers red credit card', 
-                                     'after auto-pay', 'price before incentives', 'rogers satellite included']:
-                    continue
-                # Skip if contains $ (price)
-                if '$' in text:
-                    continue
-                # Skip if contains "per mo" or "/mo" (price)
-                if 'per mo' in text.lower() or '/mo' in text.lower():
-                    continue
-                # Plan names are typically single capitalized words or short phrases
-                # Use heuristics rather than hardcoded names for flexibility
-                if text[0].isupper() and len(text) < 50:
-                    # If it's a short capitalized word/phrase, treat as plan name
-                    # This works for any plan name: Essentials, Popular, Ultimate, etc.
-                    if len(text.split()) <= 3:
-                        plan_name = text
-                        break
+            plan_name = AdvancedHTMLStripper._extract_plan_name(tile)
             
             if not plan_name:
                 continue
@@ -129,11 +433,11 @@ class AdvancedHTMLStripper:
             data_amount = AdvancedHTMLStripper._extract_data_amount(tile)
             
             # Create deduplication key
-            key = f"{plan_name}|{price}|{data_amount}"
+            key = (plan_name, price, data_amount)
             
             # Keep only first occurrence
             if key not in seen_keys:
-                seen_keys[key] = True
+                seen_keys.add(key)
                 unique_plans.append({
                     'tile': tile,
                     'name': plan_name,
@@ -144,23 +448,46 @@ class AdvancedHTMLStripper:
         
         return unique_plans
     
+    @staticmethod
+    def _extract_plan_name(tile) -> Optional[str]:
+        """Plan name = first meaningful <p> inside the tile (stops at the first match)"""
+        for p in tile.descendants:
+            if p.name != 'p':
+                continue
+            text = AdvancedHTMLStripper._stripped_text(p)
+            # Skip if empty or too short
+            if not text or len(text) < 2:
+                continue
+            # Skip known label text
+            lowered = text.lower()
+            if lowered in _ROGERS_LABELS:
+                continue
+            # Skip if contains $, "per mo" or "/mo" (price)
+            if '$' in text or 'per mo' in lowered or '/mo' in lowered:
+                continue
+            # Plan names are typically single capitalized words or short phrases
+            # Use heuristics rather than hardcoded names for flexibility
+            # This works for any plan name: Essentials, Popular, Ultimate, etc.
+            if text[0].isupper() and len(text) < 50 and len(text.split()) <= 3:
+                return text
+        return None
+    
     @staticmethod
     def _extract_price(tile) -> str:
         """Extract price from tile - first $NNN inside <ds-price> or <span> containing 'per mo'"""
         # Try ds-price first
-        ds_price = tile.find('ds-price') or tile.find(class_=re.compile('price', re.I))
+        ds_price = tile.find('ds-price') or tile.find(class_=_RE_PRICE_CLASS)
         if ds_price:
-            price_text = ds_price.get_text()
-            price_match = re.search(r'\$\d+(?:\.\d+)?', price_text)
-            if price_match:
-                return price_match.group(0)
+            price = AdvancedHTMLStripper._first_dollar_amount(ds_price)
+            if price:
+                return price
         
         # Try spans with "per mo"
         spans = tile.find_all('span')
         for span in spans:
             text = span.get_text()
             if 'per mo' in text.lower():
-                price_match = re.search(r'\$\d+(?:\.\d+)?', text)
+                price_match = _RE_DOLLAR.search(text)
                 if price_match:
                     return price_match.group(0)
         
@@ -172,8 +499,7 @@ class AdvancedHTMLStripper:
         # Find Features section
         features_ul = None
         for ul in tile.find_all('ul'):
-            parent_text = ul.find_parent().get_text() if ul.find_parent() else ""
-            if 'features' in parent_text.lower() or 'feature' in parent_text.lower():
+            if ul.parent is not None and AdvancedHTMLStripper._mentions_feature(ul.parent):
                 features_ul = ul
                 break
         
@@ -181,43 +507,41 @@ class AdvancedHTMLStripper:
             # Fallback: find any ul with li containing GB/Unlimited
             for ul in tile.find_all('ul'):
                 for li in ul.find_all('li'):
-                    text = li.get_text()
-                    if re.search(r'\d+\s*GB|Unlimited', text, re.I):
-                        data_match = re.search(r'(\d+\s*GB|Unlimited)', text, re.I)
-                        if data_match:
-                            return data_match.group(1)
+                    data_match = _RE_DATA.search(li.get_text())
+                    if data_match:
+                        return data_match.group(1)
             return "unknown"
         
         # Look for data line in features
         for li in features_ul.find_all('li'):
-            text = li.get_text()
-            if re.search(r'\d+\s*GB|Unlimited', text, re.I):
-                data_match = re.search(r'(\d+\s*GB|Unlimited)', text, re.I)
-                if data_match:
-                    return data_match.group(1)
+            data_match = _RE_DATA.search(li.get_text())
+            if data_match:
+                return data_match.group(1)
         
         return "unknown"
     
     @staticmethod
-    def _normalize_plan(tile) -> Optional[Dict[str, Any]]:
-        """Normalize a single plan tile to minimal semantic structure"""
+    def _mentions_feature(node) -> bool:
+        """'feature' in node.get_text().lower(), stopping at the first hit"""
+        tail = ''
+        for string in node.strings:
+            # Keep the last few chars so a word split across tags still matches
+            text = tail + string.lower()
+            if 'feature' in text:
+                return True
+            tail = text[-6:]
+        return False
+    
+    @staticmethod
+    def _normalize_plan(tile, plan_name: Optional[str] = None,
+                        data_amount: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Normalize a single plan tile to minimal semantic structure
+        
+        plan_name/data_amount may be passed in from deduplication to avoid re-extracting them
+        """
         # Extract plan name (same logic as deduplication)
-        plan_name = None
-        for p in tile.find_all('p'):
-            text = p.get_text(strip=True)
-            if not text or len(text) < 2:
-                continue
-            if text.lower() in ['features', 'plan perks', 'get 3% cash back value with a rogers red credit card', 
-                                 'after auto-pay', 'price before incentives', 'rogers satellite included']:
-                continue
-            if '$' in text or 'per mo' in text.lower() or '/mo' in text.lower():
-                continue
-            if text[0].isupper() and len(text) < 50:
-                # Use heuristics: short capitalized word/phrase = plan name
-                # This works for any plan name without hardcoding
-                if len(text.split()) <= 3:
-                    plan_name = text
-                    break
+        if not plan_name:
+            plan_name = AdvancedHTMLStripper._extract_plan_name(tile)
         plan_name = plan_name or "Unknown"
         
         # Extract price details
@@ -225,13 +549,10 @@ class AdvancedHTMLStripper:
         price = AdvancedHTMLStripper._extract_final_price(tile)
         
         # Extract data amount and discount-specific text
-        data_amount = AdvancedHTMLStripper._extract_data_amount(tile)
+        if data_amount is None:
+            data_amount = AdvancedHTMLStripper._extract_data_amount(tile)
         features = AdvancedHTMLStripper._extract_features(tile)
-        discount_keywords = ['discount', 'savings', 'price lock', 'bundle', 'family', 'per line']
-        discounts = [
-            feature for feature in features
-            if any(keyword in feature.lower() for keyword in discount_keywords)
-        ]
+        discounts = [feature for feature in features if _RE_ROGERS_DISCOUNT.search(feature)]
         
         return {
             'name': plan_name,
@@ -246,22 +567,20 @@ class AdvancedHTMLStripper:
     @staticmethod
     def _extract_final_price(tile) -> str:
         """Extract final monthly price (skip 'Price before incentives')"""
-        from copy import deepcopy
-        tile_copy = deepcopy(tile)
-        
-        # Find ds-price or price spans
-        ds_price = tile_copy.find('ds-price') or tile_copy.find(class_=re.compile('price', re.I))
+        # Read-only lookups - no need to copy the tile
+        ds_price = tile.find('ds-price') or tile.find(class_=_RE_PRICE_CLASS)
         if ds_price:
             price_text = ds_price.get_text()
-            price_match = re.search(r'\$\d+(?:\.\d+)?(?:\s*per\s*mo|\s*/mo)?', price_text, re.I)
+            price_match = _RE_PRICE_FULL.search(price_text)
             if price_match:
                 return price_match.group(0).strip()
         
         # Fallback: search all spans
-        for span in tile_copy.find_all('span'):
+        for span in tile.find_all('span'):
             text = span.get_text()
-            if 'per mo' in text.lower() or '/mo' in text.lower():
-                price_match = re.search(r'\$\d+(?:\.\d+)?', text)
+            lowered = text.lower()
+            if 'per mo' in lowered or '/mo' in lowered:
+                price_match = _RE_DOLLAR.search(text)
                 if price_match:
                     return f"{price_match.group(0)}/mo"
         
@@ -270,10 +589,10 @@ class AdvancedHTMLStripper:
     @staticmethod
     def _extract_price_before_incentives(tile) -> Optional[str]:
         """Find the 'Price before incentives' string if present."""
-        elem = tile.find(string=re.compile(r'Price before incentives', re.I))
+        elem = tile.find(string=_RE_PRICE_BEFORE_INCENTIVES)
         if elem:
             parent_text = elem.find_parent().get_text(" ", strip=True) if elem.find_parent() else elem
-            match = re.search(r'\$\d+(?:\.\d+)?', parent_text)
+            match = _RE_DOLLAR.search(parent_text)
             if match:
                 return match.group(0)
         return None
@@ -282,18 +601,18 @@ class AdvancedHTMLStripper:
     def _extract_features(tile) -> List[str]:
         """Extract and flatten features list"""
         features = []
+        seen_features = set()
         
         # Find Features section
         features_section = None
         for ul in tile.find_all('ul'):
             # Check if this is the features list
-            parent_text = ul.find_parent().get_text() if ul.find_parent() else ""
             siblings = ul.find_previous_siblings()
             for sibling in siblings:
                 if isinstance(sibling, NavigableString):
                     continue
                 sibling_text = sibling.get_text() if hasattr(sibling, 'get_text') else ""
-                if 'features' in sibling_text.lower() or 'feature' in sibling_text.lower():
+                if 'feature' in sibling_text.lower():  # also covers 'features'
                     features_section = ul
                     break
         
@@ -305,60 +624,93 @@ class AdvancedHTMLStripper:
                     break
         
         if features_section:
-            # First, remove all <sup> tags from the features section
-            for sup in features_section.find_all('sup'):
-                sup.decompose()
-            
-            # Flatten nested lists and clean features
-            for li in features_section.find_all('li', recursive=True):
-                text = li.get_text(strip=True)
+            # Flatten nested lists and clean features - one walk, <sup> footnote subtrees skipped
+            stack = list(reversed(features_section.contents))
+            while stack:
+                li = stack.pop()
+                if isinstance(li, NavigableString) or li.name == 'sup':
+                    continue
+                stack.extend(reversed(li.contents))
+                if li.name != 'li':
+                    continue
+                text = AdvancedHTMLStripper._text_without_sup(li, strip=True)
                 # Skip if it's just "Features" label
-                if not text or text.lower() in ['features', 'feature'] or len(text) < 3:
+                if not text or text.lower() in ('features', 'feature') or len(text) < 3:
                     continue
                 
                 # Remove trailing footnote numbers (if any remain)
-                text = re.sub(r'\d+$', '', text).strip()
+                text = _RE_TRAILING_DIGIT.sub('', text).strip()
                 
                 # Remove nested list markers
-                text = re.sub(r'^\s*[•\-\*]\s*', '', text)
+                text = _RE_BULLET.sub('', text)
                 
                 # Clean up multiple spaces
-                text = re.sub(r'\s+', ' ', text).strip()
+                text = _RE_WS.sub(' ', text).strip()
                 
                 # Skip duplicates
-                if text and len(text) > 3 and text not in features:
+                if text and len(text) > 3 and text not in seen_features:
+                    seen_features.add(text)
                     features.append(text)
         
         return features
     
     @staticmethod
-    def _extract_roaming(tile) -> Optional[str]:
-        """Extract roaming information"""
-        text = tile.get_text()
-        roaming_match = re.search(r'roam[^.]*\.?', text, re.I)
-        if roaming_match:
-            return roaming_match.group(0).strip()
-        return None
+    def _stripped_text(node) -> str:
+        """node.get_text(strip=True), without the subtree walk when it holds a single string"""
+        string = node.string
+        if type(string) is NavigableString:
+            return string.strip()
+        return node.get_text(strip=True)
     
     @staticmethod
-    def _extract_bonuses(tile) -> List[str]:
-        """Extract bonus offers"""
-        bonuses = []
-        text = tile.get_text()
-        
-        # Look for common bonus patterns
-        bonus_patterns = [
-            r'Free\s+[^.]*',
-            r'\d+%\s+off[^.]*',
-            r'\$\d+\s+credit[^.]*',
-            r'Cash\s+back[^.]*'
-        ]
-        
-        for pattern in bonus_patterns:
-            matches = re.findall(pattern, text, re.I)
-            bonuses.extend(matches)
-        
-        return bonuses[:3]  # Limit to first 3
+    def _first_dollar_amount(node) -> Optional[str]:
+        """First $NN(.NN) in node.get_text(), read string by string - stops at the first settled match"""
+        buffer = ''
+        for string in node.strings:
+            buffer += string
+            match = _RE_DOLLAR.search(buffer)
+            if match is None:
+                # Only a trailing '$' can start a match with the next string
+                buffer = '$' if buffer.endswith('$') else ''
+                continue
+            end = match.end()
+            if end == len(buffer) or (end == len(buffer) - 1 and buffer[end] == '.'):
+                # Digits/decimals may continue in the next string
+                buffer = buffer[match.start():]
+                continue
+            return match.group(0)
+        match = _RE_DOLLAR.search(buffer)
+        return match.group(0) if match else None
+    
+    @staticmethod
+    def _iter_headings(node):
+        """h1-h6 descendants of node in document order, yielded lazily so callers can stop at the first usable one"""
+        return (child for child in node.descendants if child.name in _HEADING_TAGS)
+    
+    @staticmethod
+    def _text_without_sup(node, separator: str = "", strip: bool = False) -> str:
+        """node.get_text(separator, strip=strip) as if every <sup> footnote had been removed"""
+        parts = []
+        stack = list(reversed(node.contents))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, NavigableString):
+                # Same string types get_text() collects (skips comments, scripts, etc.)
+                if type(child) is NavigableString or type(child) is CData:
+                    if strip:
+                        child = child.strip()
+                        if not child:
+                            continue
+                    parts.append(child)
+            elif child.name != 'sup':
+                stack.extend(reversed(child.contents))
+        return separator.join(parts)
+    
+    @staticmethod
+    def _tile_fingerprint(tile) -> str:
+        """Normalized tile text (no <sup> footnotes, collapsed whitespace, lowercase)"""
+        text = AdvancedHTMLStripper._text_without_sup(tile, ' ', strip=True)
+        return _RE_WS.sub(' ', text).lower()
     
     @staticmethod
     def _build_final_html(normalized_plans: List[Dict[str, Any]]) -> str:
@@ -367,48 +719,49 @@ class AdvancedHTMLStripper:
         
         for plan in normalized_plans:
             html_parts.append('<div class="plan">')
-            html_parts.append(f'  <h2>{plan["name"]}</h2>')
+            html_parts.append(f'  <h2>{html.escape(str(plan["name"]), quote=False)}</h2>')
             
             if plan.get('regular_price') and plan.get('price') and plan['regular_price'] != plan['price']:
-                html_parts.append(f'  <p class="regular-price">Regular price: {plan["regular_price"]}</p>')
+                html_parts.append(f'  <p class="regular-price">Regular price: {html.escape(str(plan["regular_price"]), quote=False)}</p>')
             
             if plan.get('price') and plan['price'] != 'unknown':
-                html_parts.append(f'  <p class="price">Current price: {plan["price"]}</p>')
+                html_parts.append(f'  <p class="price">Current price: {html.escape(str(plan["price"]), quote=False)}</p>')
             
             if plan.get('bundle_price'):
-                html_parts.append(f'  <p class="bundle-price">Bundled price: {plan["bundle_price"]}</p>')
+                html_parts.append(f'  <p class="bundle-price">Bundled price: {html.escape(str(plan["bundle_price"]), quote=False)}</p>')
             
             if plan.get('data') and plan['data'] != 'unknown':
-                html_parts.append(f'  <p class="data">Data: {plan["data"]}</p>')
+                html_parts.append(f'  <p class="data">Data: {html.escape(str(plan["data"]), quote=False)}</p>')
             
             if plan.get('network'):
-                html_parts.append(f'  <p class="network">{plan["network"]}</p>')
+                html_parts.append(f'  <p class="network">{html.escape(str(plan["network"]), quote=False)}</p>')
             
             if plan.get('roaming'):
-                html_parts.append(f'  <p class="roaming">{plan["roaming"]}</p>')
+                html_parts.append(f'  <p class="roaming">{html.escape(str(plan["roaming"]), quote=False)}</p>')
             
             if plan.get('features'):
                 html_parts.append('  <ul class="features">')
                 for feature in plan['features']:
-                    # Clean feature text - remove ALL whitespace (spaces, newlines, tabs) and replace with single space
-                    clean_feature = re.sub(r'\s+', ' ', str(feature)).strip()
-                    # Remove any remaining newlines or tabs that might have been missed
-                    clean_feature = clean_feature.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-                    clean_feature = re.sub(r'\s+', ' ', clean_feature).strip()
+                    # Collapse ALL whitespace (spaces, newlines, tabs) to single spaces
+                    clean_feature = _RE_WS.sub(' ', str(feature)).strip()
                     if clean_feature:
-                        html_parts.append(f'    <li>{clean_feature}</li>')
+                        html_parts.append(f'    <li>{html.escape(clean_feature, quote=False)}</li>')
                 html_parts.append('  </ul>')
             
             if plan.get('discounts'):
                 html_parts.append('  <ul class="discounts">')
                 for discount in plan['discounts']:
-                    html_parts.append(f'    <li>{discount}</li>')
+                    clean_discount = _RE_WS.sub(' ', str(discount)).strip()
+                    if clean_discount:
+                        html_parts.append(f'    <li>{html.escape(clean_discount, quote=False)}</li>')
                 html_parts.append('  </ul>')
             
             if plan.get('promotions'):
                 html_parts.append('  <ul class="promotions">')
                 for promo in plan['promotions']:
-                    html_parts.append(f'    <li>{promo}</li>')
+                    clean_promo = _RE_WS.sub(' ', str(promo)).strip()
+                    if clean_promo:
+                        html_parts.append(f'    <li>{html.escape(clean_promo, quote=False)}</li>')
                 html_parts.append('  </ul>')
             
             html_parts.append('</div>')
@@ -416,7 +769,7 @@ class AdvancedHTMLStripper:
         return '\n'.join(html_parts)
     
     @staticmethod
-    def strip_telus_html(html_content: str) -> Dict[str, Any]:
+    def strip_telus_html(html_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Apply advanced stripping rules to Telus HTML
         
@@ -432,20 +785,22 @@ class AdvancedHTMLStripper:
         9. Extract ribbon text, remove wrapper
         10. Output minimal JSON-ready HTML
         """
+        html_content = AdvancedHTMLStripper._decode_html(html_content)
         original_size = len(html_content)
         original_tokens = original_size // 4
         
         print("  🔍 Advanced Telus stripping: Attribute removal + deduplication...")
         
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
         # Step 1: Find plan tiles BEFORE removing attributes (needed for deduplication)
-        plan_tiles = soup.select('[data-testid*="mfe-rate-plan-tile-"][data-testid*="-container"]')
-        
-        # Fallback: try to find by card ID
-        if not plan_tiles:
-            plan_tiles = soup.select('[data-testid*="mfe-rate-plan-card-id-"]')
+        plan_tiles = []
+        if _TELUS_TILE_MARKER in html_content:
+            # Parse HTML (plan tiles only)
+            soup = BeautifulSoup(html_content, _FAST_HTML_PARSER, parse_only=_TELUS_STRAINER)
+            plan_tiles = soup.find_all(attrs={'data-testid': _is_telus_tile_container_testid})
+            
+            # Fallback: try to find by card ID
+            if not plan_tiles:
+                plan_tiles = soup.find_all(attrs={'data-testid': _is_telus_card_id_testid})
         
         # Step 2: Deduplicate plans BEFORE stripping attributes (need data-testid for extraction)
         unique_plans_data = AdvancedHTMLStripper._deduplicate_telus_plans(plan_tiles)
@@ -454,79 +809,87 @@ class AdvancedHTMLStripper:
         # Step 2.5: Normalize plans BEFORE removing attributes (need data-testid for extraction)
         normalized_plans = []
         for plan_data in unique_plans_data:
-            normalized = AdvancedHTMLStripper._normalize_telus_plan(plan_data['tile'])
+            normalized = AdvancedHTMLStripper._normalize_telus_plan(
+                plan_data['tile'], price=plan_data['price'], data_amount=plan_data['data']
+            )
             if normalized:
                 normalized_plans.append(normalized)
         
         print(f"  ✅ Normalized {len(normalized_plans)} plans")
         
-        # Step 3: Now remove attributes and clean up
-        # Remove all data-testid attributes
-        for tag in soup.find_all(attrs={'data-testid': True}):
-            del tag['data-testid']
-        
-        # Remove all aria-* attributes
-        for tag in soup.find_all():
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('aria-')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-        
-        # Remove dir="auto" attributes
-        for tag in soup.find_all(attrs={'dir': 'auto'}):
-            del tag['dir']
-        
-        # Remove all <sup> footnotes
-        for sup in soup.find_all('sup'):
-            sup.decompose()
-        
-        # Remove all <button> elements
-        for button in soup.find_all('button'):
-            button.decompose()
-        
-        # Convert promotion callouts into simple text notes rather than removing them entirely
-        for div in soup.find_all('div'):
-            if div.find(string=re.compile(r'Price includes savings', re.I)):
-                text_content = div.get_text(" ", strip=True)
-                replacement = soup.new_tag("p", **{"class": "discount-note"})
-                replacement.string = text_content
-                div.replace_with(replacement)
-        
-        # Convert "Unlock offers" sections to plain text (they contain discount context)
-        for div in soup.find_all('div'):
-            if div.find(string=re.compile(r'Unlock these offers', re.I)):
-                text_content = div.get_text(" ", strip=True)
-                replacement = soup.new_tag("p", **{"class": "discount-note"})
-                replacement.string = text_content
-                div.replace_with(replacement)
-        
-        # Remove "Full plan details" links (no pricing value)
-        for div in soup.find_all('div'):
-            if div.find(string=re.compile(r'Full plan details', re.I)):
-                div.decompose()
-        
-        # Extract ribbon text, remove decorative wrappers
-        for div in soup.find_all('div'):
-            ribbon_texts = ['ONLY AT TELUS', 'MOBILITY PLAN', 'ROAMING DESTINATIONS']
-            for ribbon_text in ribbon_texts:
-                if div.find(string=re.compile(ribbon_text, re.I)):
+        # Steps 3-4 only matter when no plan was extracted: the cleaned soup is then
+        # searched for h3 plan cards and returned as-is. Otherwise the output is
+        # rebuilt from normalized_plans and the cleanup would be dead work.
+        if not unique_plans_data:
+            # The strained soup only holds plan tiles (or nothing at all): re-parse the
+            # full page for the structural (h3) fallback and cleaned-HTML output
+            soup = BeautifulSoup(html_content, _FAST_HTML_PARSER)
+            
+            # Step 3: Remove attributes and clean up
+            # One walk: drop <sup> footnotes and <button> elements, and strip
+            # data-testid, aria-* and dir="auto" attributes from everything else
+            for tag in soup.find_all(True):
+                if tag.decomposed:
+                    # Inside a <sup>/<button> removed earlier in this walk
+                    continue
+                if tag.name in ('sup', 'button'):
+                    tag.decompose()
+                    continue
+                if tag.attrs:
+                    # Rebuild once instead of deleting keys one at a time
+                    tag.attrs = {
+                        attr: value for attr, value in tag.attrs.items()
+                        if attr != 'data-testid' and not attr.startswith('aria-')
+                        and not (attr == 'dir' and value == 'auto')
+                    }
+            
+            # Single pass over all divs (document order, outer before inner):
+            # - promotion callouts / "Unlock offers" sections -> simple text notes
+            # - "Full plan details" links -> removed (no pricing value)
+            # - ribbons -> plain text, decorative wrappers removed
+            # - empty divs -> removed, along with enclosing divs they leave empty
+            # A rewritten div's inner divs are detached, so they are skipped.
+            detached = set()
+            for div in soup.find_all('div'):
+                if id(div) in detached:
+                    continue
+                if not div.find(string=_RE_TELUS_CLEANUP):
+                    # No descendant tags exactly when no direct child is a tag
+                    while not any(isinstance(child, Tag) for child in div.contents) and not div.get_text(strip=True):
+                        parent = div.parent
+                        div.decompose()
+                        if parent is None or parent.name != 'div':
+                            break
+                        div = parent
+                    continue
+                
+                detached.update(id(inner) for inner in div.find_all('div'))
+                if div.find(string=_RE_PRICE_INCLUDES_SAVINGS) or div.find(string=_RE_UNLOCK_OFFERS):
+                    text_content = div.get_text(" ", strip=True)
+                    replacement = soup.new_tag("p", **{"class": "discount-note"})
+                    replacement.string = text_content
+                    div.replace_with(replacement)
+                elif div.find(string=_RE_FULL_PLAN_DETAILS):
+                    div.decompose()
+                else:
                     text_content = div.get_text(strip=True)
                     div.clear()
                     div.string = text_content
-                    break
-        
-        # Remove empty divs
-        for empty_div in soup.find_all('div'):
-            if not empty_div.get_text(strip=True) and len(empty_div.find_all()) == 0:
-                empty_div.decompose()
-        
-        # Step 4: Find plan tiles again after cleaning (by h3 structure)
-        if not unique_plans_data:
+            
+            # Step 4: Find plan tiles again after cleaning (by h3 structure)
+            # Count descendant <h3>s per element once instead of re-scanning while climbing
+            headings = soup.find_all('h3')
+            h3_counts: Dict[int, int] = {}
+            for h3 in headings:
+                for ancestor in h3.parents:
+                    h3_counts[id(ancestor)] = h3_counts.get(id(ancestor), 0) + 1
+            
             plan_cards = []
-            for h3 in soup.find_all('h3'):
+            for h3 in headings:
                 parent = h3.find_parent('div')
                 if parent and parent not in plan_cards:
                     for _ in range(3):
-                        if parent and len(parent.find_all('h3')) == 1:
+                        if parent and h3_counts.get(id(parent)) == 1:
                             plan_cards.append(parent)
                             break
                         parent = parent.find_parent('div') if parent else None
@@ -581,7 +944,7 @@ class AdvancedHTMLStripper:
     @staticmethod
     def _deduplicate_telus_plans(plan_tiles: List) -> List[Dict[str, Any]]:
         """Deduplicate Telus plan tiles by (name, price, data)"""
-        seen_keys = {}
+        seen_keys = set()
         unique_plans = []
         
         for tile in plan_tiles:
@@ -594,14 +957,15 @@ class AdvancedHTMLStripper:
             # If no h3, try to find plan name by heuristics
             if not plan_name:
                 for p in tile.find_all('p'):
-                    text = p.get_text(strip=True)
+                    text = AdvancedHTMLStripper._stripped_text(p)
                     if not text or len(text) < 2:
                         continue
                     # Skip price text
-                    if '$' in text or 'per mo' in text.lower() or '/mo' in text.lower():
+                    lowered = text.lower()
+                    if '$' in text or 'per mo' in lowered or '/mo' in lowered:
                         continue
                     # Skip known non-plan text
-                    if text.lower() in ['features', 'unlock these offers', 'mobility plans', 'talk & text']:
+                    if lowered in _TELUS_LABELS:
                         continue
                     # Plan names are short capitalized phrases
                     if text[0].isupper() and len(text) < 50 and len(text.split()) <= 5:
@@ -618,10 +982,10 @@ class AdvancedHTMLStripper:
             data_amount = AdvancedHTMLStripper._extract_telus_data(tile)
             
             # Create deduplication key
-            key = f"{plan_name}|{price}|{data_amount}"
+            key = (plan_name, price, data_amount)
             
             if key not in seen_keys:
-                seen_keys[key] = True
+                seen_keys.add(key)
                 unique_plans.append({
                     'tile': tile,
                     'name': plan_name,
@@ -633,45 +997,42 @@ class AdvancedHTMLStripper:
         return unique_plans
     
     @staticmethod
-    def _extract_telus_price(tile) -> str:
-        """Extract final price from Telus tile (works with or without data-testid)"""
+    def _extract_telus_price(tile, text: Optional[str] = None) -> str:
+        """Extract final price from Telus tile (works with or without data-testid)
+        
+        text: optional cached tile.get_text()
+        """
         # First try: look for price-lockup section by data-testid (before removal)
-        price_lockup = tile.find(attrs={'data-testid': lambda x: x and 'plan-price-lockup' in str(x)})
+        price_lockup = tile.find(attrs={'data-testid': _is_telus_price_lockup_testid})
         if price_lockup:
-            price_text = price_lockup.get_text()
-            price_match = re.search(r'\$\d+(?:\.\d+)?', price_text)
-            if price_match:
-                return price_match.group(0)
+            price = AdvancedHTMLStripper._first_dollar_amount(price_lockup)
+            if price:
+                return price
         
         # Fallback: look for price pattern in text
-        text = tile.get_text()
-        price_pattern = r'\$\d+(?:\.\d+)?(?:\s+per\s+month|\s+/mo)?'
-        price_match = re.search(price_pattern, text, re.I)
+        if text is None:
+            text = tile.get_text()
+        price_match = _RE_TELUS_PRICE.search(text)
         if price_match:
             price_str = price_match.group(0)
             return price_str.replace(' per month', '/mo').replace(' /mo', '/mo')
         
-        # Last resort: find any $NN pattern
-        price_match = re.search(r'\$\d+(?:\.\d+)?', text)
-        if price_match:
-            return price_match.group(0)
-        
         return "unknown"
     
     @staticmethod
     def _extract_telus_regular_price(tile) -> Optional[str]:
         """Capture regular (pre-discount) price if displayed."""
-        regular_section = tile.find(attrs={'data-testid': lambda x: x and 'plan-price-before-discounts' in str(x)})
+        regular_section = tile.find(attrs={'data-testid': _is_telus_regular_price_testid})
         if regular_section:
-            match = re.search(r'\$\d+(?:\.\d+)?', regular_section.get_text())
-            if match:
-                return match.group(0)
+            price = AdvancedHTMLStripper._first_dollar_amount(regular_section)
+            if price:
+                return price
         # also check for strikethrough values
         strike = tile.find('s')
         if strike:
-            match = re.search(r'\$\d+(?:\.\d+)?', strike.get_text())
-            if match:
-                return match.group(0)
+            price = AdvancedHTMLStripper._first_dollar_amount(strike)
+            if price:
+                return price
         return None
     
     @staticmethod
@@ -680,7 +1041,7 @@ class AdvancedHTMLStripper:
         discount_texts: List[str] = []
         selectors = [
             {'attrs': {'data-testid': 'promotion-callout-legal-text'}},
-            {'attrs': {'data-testid': re.compile(r'promotion-benefit-text')}},
+            {'attrs': {'data-testid': _RE_PROMOTION_BENEFIT}},
         ]
         for selector in selectors:
             for elem in tile.find_all(**selector):
@@ -689,33 +1050,28 @@ class AdvancedHTMLStripper:
                     discount_texts.append(text)
         
         # Also look for generic strings mentioning savings/discount/price lock
-        keywords = ['discount', 'savings', 'price lock', 'per line', 'family']
         for text in tile.stripped_strings:
             normalized = ' '.join(text.split())
             if len(normalized) < 6:
                 continue
-            lower = normalized.lower()
-            if any(keyword in lower for keyword in keywords):
+            if _RE_TELUS_DISCOUNT.search(normalized):
                 discount_texts.append(normalized)
         
         # Deduplicate while preserving order
-        seen = set()
-        unique = []
-        for entry in discount_texts:
-            if entry not in seen:
-                seen.add(entry)
-                unique.append(entry)
-        return unique[:10]
+        return list(dict.fromkeys(discount_texts))[:10]
     
     @staticmethod
-    def _extract_telus_data(tile) -> str:
-        """Extract data amount from Telus tile (works with or without data-testid)"""
+    def _extract_telus_data(tile, text: Optional[str] = None) -> str:
+        """Extract data amount from Telus tile (works with or without data-testid)
+        
+        text: optional cached tile.get_text()
+        """
         # First try: look for data-bucket by data-testid (before removal)
-        data_bucket = tile.find(attrs={'data-testid': lambda x: x and 'mfe-rate-plan-data-bucket-amount' in str(x)})
+        data_bucket = tile.find(attrs={'data-testid': _is_telus_data_amount_testid})
         if data_bucket:
             data_text = data_bucket.get_text(strip=True)
             # Check if there's a speed indicator nearby
-            speed_bucket = tile.find(attrs={'data-testid': lambda x: x and 'mfe-rate-plan-data-bucket-speed' in str(x)})
+            speed_bucket = tile.find(attrs={'data-testid': _is_telus_data_speed_testid})
             if speed_bucket:
                 speed_text = speed_bucket.get_text(strip=True)
                 if 'GB' in speed_text:
@@ -724,21 +1080,24 @@ class AdvancedHTMLStripper:
             return f"{data_text} GB" if data_text.isdigit() else data_text
         
         # Fallback: search by pattern
-        text = tile.get_text()
-        data_match = re.search(r'(\d+\s*GB(?:\s+at\s+\d+G(?:\+)?\s+Speed)?|Unlimited)', text, re.I)
-        if data_match:
-            return data_match.group(1)
-        
-        # Last resort: simpler pattern
-        data_match = re.search(r'(\d+\s*GB|Unlimited)', text, re.I)
+        if text is None:
+            text = tile.get_text()
+        data_match = _RE_TELUS_DATA.search(text)
         if data_match:
             return data_match.group(1)
         
         return "unknown"
     
     @staticmethod
-    def _normalize_telus_plan(tile) -> Optional[Dict[str, Any]]:
-        """Normalize a Telus plan tile to minimal structure"""
+    def _normalize_telus_plan(tile, price: Optional[str] = None,
+                              data_amount: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Normalize a Telus plan tile to minimal structure
+        
+        price/data_amount may be passed in from deduplication to avoid re-extracting them
+        """
+        # Full tile text, shared by the price/data fallbacks and promotion/ribbon scans
+        tile_text = tile.get_text()
+        
         # Extract plan name
         plan_name = "Unknown"
         h3 = tile.find('h3')
@@ -746,46 +1105,36 @@ class AdvancedHTMLStripper:
             plan_name = h3.get_text(strip=True)
         
         # Extract prices
-        price = AdvancedHTMLStripper._extract_telus_price(tile)
+        if price is None:
+            price = AdvancedHTMLStripper._extract_telus_price(tile, tile_text)
         regular_price = AdvancedHTMLStripper._extract_telus_regular_price(tile)
         
         # Extract data
-        data_amount = AdvancedHTMLStripper._extract_telus_data(tile)
+        if data_amount is None:
+            data_amount = AdvancedHTMLStripper._extract_telus_data(tile, tile_text)
         
         # Extract discount-focused features
-        def _eligible_feature(text: str) -> bool:
-            lowered = text.lower()
-            return any(keyword in lowered for keyword in ['discount', 'price lock', 'per line', 'bundle', 'easy roam'])
-        
         features: List[str] = []
         for li in tile.find_all('li'):
             text = li.get_text(" ", strip=True)
-            if text and len(text) > 8 and _eligible_feature(text):
+            if text and len(text) > 8 and _RE_TELUS_FEATURE.search(text):
                 features.append(text)
         
         # Collect discount snippets directly
         discounts = AdvancedHTMLStripper._extract_telus_discount_texts(tile)
         
         # Extract promotions - look for text containing "discount", "lock", "roam"
+        # Lazy scans: at most 2 matches per pattern, stop once 3 promotions are collected
         promotions = []
-        text = tile.get_text()
-        promo_patterns = [
-            r'\d+[- ]Year.*?Lock',
-            r'Easy Roam[^.]*',
-            r'discount[^.]*',
-            r'Recurring discount[^.]*'
-        ]
-        for pattern in promo_patterns:
-            matches = re.findall(pattern, text, re.I)
-            promotions.extend(m[:100] for m in matches[:2])  # Limit length and count
-        
-        # Extract ribbon/badge text - look for known badge texts
-        ribbon = None
-        ribbon_texts = ['ONLY AT TELUS', 'MOBILITY PLAN', 'ROAMING DESTINATIONS']
-        for ribbon_text in ribbon_texts:
-            if ribbon_text in text:
-                ribbon = ribbon_text
+        for pattern in _RE_TELUS_PROMO_PATTERNS:
+            if len(promotions) >= 3:
                 break
+            promotions.extend(m.group(0)[:100] for m in islice(pattern.finditer(tile_text), 2))  # Limit length and count
+        
+        # Extract ribbon/badge text - first known badge text (in list order) the tile contains.
+        # Plain substring tests on purpose: three C-level str searches beat one regex
+        # alternation scan, and an alternation would pick the leftmost hit, not list order.
+        ribbon = next((ribbon_text for ribbon_text in _TELUS_RIBBON_TEXTS if ribbon_text in tile_text), None)
         
         return {
             'name': plan_name,
@@ -799,35 +1148,31 @@ class AdvancedHTMLStripper:
         }
     
     @staticmethod
-    def strip_bell_html(html_content: str) -> Dict[str, Any]:
+    def strip_bell_html(html_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Apply advanced stripping rules to Bell HTML
         
         Steps:
-        1. Find plan containers by data-product-id
-        2. Deduplicate plans by (h3_name, price, data_amount) - BEFORE attribute removal
-        3. Normalize plans - BEFORE attribute removal (preserve structure)
-        4. Remove nav/header/footer
-        5. Remove modals (aria-modal)
-        6. Remove forms
-        7. Remove all aria-* attributes
-        8. Remove all <sup> footnotes
-        9. Remove all <button> elements
-        10. Remove empty divs
-        11. Remove promotional text sections
-        12. Remove data-same-height-* attributes
-        13. Output minimal JSON-ready HTML
+        1. Find plan containers by data-product-id (only those subtrees are parsed)
+        2. Deduplicate plans by (h3_name, price, data_amount)
+        3. Normalize plans to minimal semantic structure
+        4. Output minimal JSON-ready HTML
+        
+        Nav, modals, forms, footnotes, buttons and promo text never reach the
+        output - it is rebuilt from the normalized plans only.
         """
+        html_content = AdvancedHTMLStripper._decode_html(html_content)
         original_size = len(html_content)
         original_tokens = original_size // 4
         
         print("  🔍 Advanced Bell stripping: Deduplication + semantic normalization...")
         
-        # Parse HTML
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Step 1: Find plan containers by data-product-id (BEFORE removing anything)
-        plan_containers = soup.find_all(attrs={'data-product-id': True})
+        # Step 1: Find plan containers by data-product-id
+        plan_containers = []
+        if _RE_BELL_CONTAINER_MARKER.search(html_content):
+            # Parse HTML (plan containers only)
+            soup = BeautifulSoup(html_content, _FAST_HTML_PARSER, parse_only=_BELL_STRAINER)
+            plan_containers = soup.find_all(attrs={'data-product-id': True})
         
         if not plan_containers:
             print("  ⚠️  No plan containers found, returning cleaned HTML")
@@ -835,82 +1180,20 @@ class AdvancedHTMLStripper:
         
         print(f"  ✅ Found {len(plan_containers)} plan containers")
         
-        # Step 2: Deduplicate plans BEFORE removing attributes
+        # Step 2: Deduplicate plans
         unique_plans_data = AdvancedHTMLStripper._deduplicate_bell_plans(plan_containers)
         print(f"  ✅ Deduplicated to {len(unique_plans_data)} unique plans")
         
-        # Step 3: Normalize plans BEFORE removing attributes (preserve structure)
+        # Step 3: Normalize plans
         normalized_plans = []
         for plan_data in unique_plans_data:
-            normalized = AdvancedHTMLStripper._normalize_bell_plan(plan_data['container'])
+            normalized = AdvancedHTMLStripper._normalize_bell_plan(plan_data['container'], plan_data['name'])
             if normalized:
                 normalized_plans.append(normalized)
         
         print(f"  ✅ Normalized {len(normalized_plans)} plans")
         
-        # Step 4: Remove navigation/header/footer
-        for tag in soup.find_all(['nav', 'header', 'footer']):
-            tag.decompose()
-        
-        # Step 5: Remove modals
-        for modal in soup.find_all(attrs={'aria-modal': True}):
-            modal.decompose()
-        
-        # Step 6: Remove forms (province selectors, etc.)
-        for form in soup.find_all('form'):
-            form.decompose()
-        
-        # Step 7: Remove all aria-* attributes
-        for tag in soup.find_all():
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('aria-')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-        
-        # Step 8: Remove all <sup> footnotes
-        for sup in soup.find_all('sup'):
-            sup.decompose()
-        
-        # Step 9: Remove all <button> elements
-        for button in soup.find_all('button'):
-            button.decompose()
-        
-        # Step 10: Remove empty divs
-        for empty_div in soup.find_all('div'):
-            if not empty_div.get_text(strip=True) and len(empty_div.find_all()) == 0:
-                empty_div.decompose()
-        
-        # Step 11: Remove promotional text sections
-        promo_texts = [
-            'New activations only',
-            'Offer ends',
-            'Available 7 days a week',
-            'All plans include',
-            'View more plans',
-            'Bring your own phone'
-        ]
-        for promo_text in promo_texts:
-            for elem in soup.find_all(string=re.compile(re.escape(promo_text), re.I)):
-                parent = elem.find_parent()
-                if parent:
-                    parent.decompose()
-        
-        # Step 12: Remove data-same-height-* attributes
-        for tag in soup.find_all():
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('data-same-height')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-        
-        # Step 13: Remove strikethrough prices (<s>), keep current price only
-        for s_tag in soup.find_all('s'):
-            s_tag.decompose()
-        
-        # Step 14: Remove "Average price per line" text (redundant)
-        for elem in soup.find_all(string=re.compile(r'Average price per line', re.I)):
-            parent = elem.find_parent()
-            if parent:
-                parent.decompose()
-        
-        # Step 15: Build final HTML from normalized plans
+        # Step 4: Build final HTML from normalized plans
         final_html = AdvancedHTMLStripper._build_final_html(normalized_plans)
         
         final_size = len(final_html)
@@ -939,7 +1222,7 @@ class AdvancedHTMLStripper:
     @staticmethod
     def _deduplicate_bell_plans(plan_containers: List) -> List[Dict[str, Any]]:
         """Deduplicate Bell plan containers by (name, price, data_amount)"""
-        seen_keys = {}
+        seen_keys = set()
         unique_plans = []
         
         for container in plan_containers:
@@ -952,33 +1235,31 @@ class AdvancedHTMLStripper:
                 continue
             
             # Skip if plan name looks like a question or modal
-            skip_keywords = ['are you', 'select an', 'how would', 'please select', 
-                           'would you like', 'back to', 'change', 'new customer']
-            plan_lower = plan_name.lower()
-            if any(keyword in plan_lower for keyword in skip_keywords):
+            if _RE_BELL_SKIP.search(plan_name):
                 continue
             
+            # Full-subtree text only once every name-based rejection has passed
             # Extract data amount (heuristic: \d+ GB pattern)
             text = container.get_text()
-            data_match = re.search(r'(\d+)\s*GB', text, re.I)
+            data_match = _RE_GB.search(text)
             data_amount = data_match.group(0) if data_match else "unknown"
             
             # Extract 1-line price (first price for deduplication)
             # Handle formats like "$105", "$105/mo", "$105/mo.", "$105.50/mo"
-            price_match = re.search(r'\$\s*\d+(?:\.\d+)?(?:\s*/?\s*mo\.?)?', text)
+            price_match = _RE_BELL_PRICE.search(text)
             if price_match:
                 price = price_match.group(0)
                 # Clean up: remove "/mo" parts for deduplication
-                price = re.sub(r'\s*/?\s*mo\.?', '', price)
-                price = re.sub(r'\s+', '', price)
+                price = _RE_MO_SUFFIX.sub('', price)
+                price = _RE_WS.sub('', price)
             else:
                 price = "unknown"
             
             # Create deduplication key
-            key = f"{plan_name}|{price}|{data_amount}"
+            key = (plan_name, price, data_amount)
             
             if key not in seen_keys:
-                seen_keys[key] = True
+                seen_keys.add(key)
                 unique_plans.append({
                     'container': container,
                     'name': plan_name,
@@ -989,14 +1270,26 @@ class AdvancedHTMLStripper:
         return unique_plans
     
     @staticmethod
-    def _normalize_bell_plan(container) -> Optional[Dict[str, Any]]:
-        """Normalize a single Bell plan container to minimal semantic structure"""
-        # Extract plan name from <h3>
-        h3 = container.find('h3')
-        plan_name = h3.get_text(strip=True) if h3 else "Unknown"
+    def _bell_keyword_flags(text: str) -> int:
+        """OR of the _BELL_KEYWORD_FLAGS classes of every keyword found in text (case-insensitive)"""
+        flags = 0
+        for match in _RE_BELL_KEYWORD.finditer(text):
+            flags |= _BELL_KEYWORD_GROUP_FLAGS[match.lastindex]
+        return flags
+    
+    @staticmethod
+    def _normalize_bell_plan(container, plan_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Normalize a single Bell plan container to minimal semantic structure
         
-        if not plan_name or len(plan_name) > 50 or '?' in plan_name:
-            return None
+        plan_name: optional name already extracted and validated by deduplication
+        """
+        if plan_name is None:
+            # Extract plan name from <h3>
+            h3 = container.find('h3')
+            plan_name = h3.get_text(strip=True) if h3 else "Unknown"
+            
+            if not plan_name or len(plan_name) > 50 or '?' in plan_name:
+                return None
         
         # Extract prices (current + regular)
         text = container.get_text(" ", strip=True)
@@ -1005,31 +1298,30 @@ class AdvancedHTMLStripper:
         
         strikethrough = container.find('s')
         if strikethrough:
-            match = re.search(r'\$\d+(?:\.\d+)?', strikethrough.get_text())
+            match = _RE_DOLLAR.search(strikethrough.get_text())
             if match:
                 regular_price = match.group(0)
         
-        price_context_pattern = r'\$\s*(\d+(?:\.\d+)?)(?:\s*/?\s*mo\.?|\s+per month)'
-        price_context_match = re.search(price_context_pattern, text, re.I)
+        price_context_match = _RE_BELL_PRICE_CONTEXT.search(text)
         if price_context_match:
             primary_price = f"${price_context_match.group(1)}"
         else:
-            all_prices = re.findall(r'\$\s*\d+(?:\.\d+)?', text)
+            all_prices = _RE_DOLLAR_SPACED.findall(text)
             meaningful_prices = [
-                re.sub(r'\s+', '', p) for p in all_prices
-                if re.sub(r'\s+', '', p) not in ('$0', '$0.00')
+                _RE_WS.sub('', p) for p in all_prices
+                if _RE_WS.sub('', p) not in ('$0', '$0.00')
             ]
             if meaningful_prices:
                 primary_price = meaningful_prices[0]
         
         # Extract data amount
-        data_match = re.search(r'(\d+)\s*GB', text, re.I)
+        data_match = _RE_GB.search(text)
         data_amount = data_match.group(0) if data_match else "unknown"
         
         def _clean_text(value: str) -> str:
-            value = re.sub(r'\s+', ' ', value).strip()
-            value = re.sub(r'\bfootnote\b', '', value, flags=re.I)
-            value = re.sub(r'\s+', ' ', value).strip()
+            value = _RE_WS.sub(' ', value).strip()
+            value = _RE_FOOTNOTE.sub('', value)
+            value = _RE_WS.sub(' ', value).strip()
             return value
         
         # Extract feature/benefit lines (network, roaming, promos, etc.)
@@ -1037,61 +1329,72 @@ class AdvancedHTMLStripper:
         network_info: Optional[str] = None
         roaming_info: Optional[str] = None
         promotion_texts: List[str] = []
-        promotion_keywords = ['offer', 'bonus', 'included', 'price lock', 'perplexity', 'promo', 'credit', 'bundle']
-        feature_lists = container.select('.g-card-plan__features li') or container.find_all('li')
+        # Every <li> text is needed by both the feature and the discount pass - extract once
+        all_lis = container.find_all('li')
+        li_texts = {id(li): li.get_text(" ", strip=True) for li in all_lis}
+        feature_lists = _BELL_FEATURE_LI_SELECTOR.select(container) or all_lis
+        # Keyword flags per <li>; the trailing-number strip on feature snippets never changes them
+        li_flags: Dict[int, int] = {}
         
         for li in feature_lists:
-            snippet = li.get_text(" ", strip=True)
+            snippet = li_texts[id(li)]
             if not snippet:
                 continue
-            snippet = re.sub(r'\s+', ' ', snippet)
-            snippet = re.sub(r'\s*\b\d+\s*$', '', snippet).strip()
+            snippet = _RE_WS.sub(' ', snippet)
+            snippet = _RE_TRAILING_NUMBER.sub('', snippet).strip()
             snippet = _clean_text(snippet)
             if not snippet:
                 continue
-            if snippet not in feature_texts:
-                feature_texts.append(snippet)
-            lower = snippet.lower()
-            if not network_info and any(keyword in lower for keyword in ['5g', 'lte', 'network']):
+            feature_texts.append(snippet)  # deduplicated below
+            flags = li_flags[id(li)] = AdvancedHTMLStripper._bell_keyword_flags(snippet)
+            if not network_info and flags & _BELL_NETWORK:
                 network_info = snippet
-            if not roaming_info and 'roam' in lower:
+            if not roaming_info and flags & _BELL_ROAMING:
                 roaming_info = snippet
-            if any(keyword in lower for keyword in promotion_keywords):
+            if flags & _BELL_PROMO:
                 promotion_texts.append(snippet)
         
         # Extract discount-focused text
-        discount_keywords = ['discount', 'price lock', 'bundle', 'per line', 'savings', 'credit', 'autopay']
+        # One pass over the <li>s: each counts once, under its nearest enclosing <ul>
+        # (a <ul> holding 'All plans include' also holds it in every enclosing <ul>)
         discounts: List[str] = []
-        for ul in container.find_all('ul'):
-            ul_text = ul.get_text(" ", strip=True)
-            if 'All plans include' in ul_text:
+        ul_included: Dict[int, bool] = {}
+        for li in all_lis:
+            ul = None
+            for ancestor in li.parents:
+                if ancestor is container:
+                    break
+                if ancestor.name == 'ul':
+                    ul = ancestor
+                    break
+            if ul is None:
                 continue
-            for li in ul.find_all('li'):
-                snippet = li.get_text(" ", strip=True)
-                snippet = _clean_text(snippet)
-                if any(keyword in snippet.lower() for keyword in discount_keywords):
-                    discounts.append(snippet)
+            included = ul_included.get(id(ul))
+            if included is None:
+                included = ul_included[id(ul)] = 'All plans include' not in ul.get_text(" ", strip=True)
+            if not included:
+                continue
+            snippet = _clean_text(li_texts[id(li)])
+            flags = li_flags.get(id(li))
+            if flags is None:
+                flags = AdvancedHTMLStripper._bell_keyword_flags(snippet)
+            if flags & _BELL_DISCOUNT:
+                discounts.append(snippet)
         
         # Include caption text (bundle/autopay notes) as discounts/promotions
-        for caption in container.select('.g-card-plan__caption'):
+        for caption in _BELL_CAPTION_SELECTOR.select(container):
             caption_text = caption.get_text(" ", strip=True)
             if not caption_text:
                 continue
             caption_text = _clean_text(caption_text)
-            if any(keyword in caption_text.lower() for keyword in discount_keywords):
+            if AdvancedHTMLStripper._bell_keyword_flags(caption_text) & _BELL_DISCOUNT:
                 discounts.append(caption_text)
             else:
                 promotion_texts.append(caption_text)
         
         # Deduplicate lists while preserving order
         def _dedupe(values: List[str]) -> List[str]:
-            seen = set()
-            deduped = []
-            for value in values:
-                if value and value not in seen:
-                    seen.add(value)
-                    deduped.append(value)
-            return deduped
+            return list(dict.fromkeys(value for value in values if value))
         
         feature_texts = _dedupe(feature_texts)
         discounts = _dedupe(discounts)
@@ -1109,6 +1412,13 @@ class AdvancedHTMLStripper:
             'promotions': promotion_texts[:5]
         }
     
+    @staticmethod
+    def _decode_html(html_content: Union[str, bytes]) -> str:
+        """Page markup as str - bytes are decoded as UTF-8 here rather than left to BeautifulSoup's encoding detection"""
+        if isinstance(html_content, bytes):
+            return html_content.decode('utf-8', errors='replace')
+        return html_content
+    
     @staticmethod
     def _basic_fallback(html_content: str, original_size: int) -> Dict[str, Any]:
         """Basic fallback if no plan tiles found"""
@@ -1129,31 +1439,33 @@ class AdvancedHTMLStripper:
         }
     
     @staticmethod
-    def strip_freedom_html(html_content: str) -> Dict[str, Any]:
+    def strip_freedom_html(html_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Apply advanced stripping rules to Freedom HTML
         
         Steps:
-        1. Find plan containers by data-testid="planComponent"
-        2. Deduplicate plans by (aria-label/name, price, data_amount) - BEFORE attribute removal
-        3. Normalize plans - BEFORE attribute removal
-        4. Remove all aria-* attributes
-        5. Remove all <sup> footnotes
-        6. Remove all <button> elements
-        7. Remove empty divs
-        8. Output minimal JSON-ready HTML
+        1. Find plan containers by data-testid="planComponent" (only those subtrees are parsed)
+        2. Deduplicate plans by (aria-label/name, price, data_amount)
+        3. Normalize plans to minimal semantic structure
+        4. Output minimal JSON-ready HTML
+        
+        aria-* attributes, footnotes, buttons and empty divs never reach the
+        output - it is rebuilt from the normalized plans only.
         
         NO hardcoded plan names - uses aria-label or heuristic name extraction
         """
+        html_content = AdvancedHTMLStripper._decode_html(html_content)
         original_size = len(html_content)
         original_tokens = original_size // 4
         
         print("  🔍 Advanced Freedom stripping: Deduplication + semantic normalization...")
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
         # Step 1: Find plan containers
-        plan_containers = soup.find_all(attrs={'data-testid': 'planComponent'})
+        plan_containers = []
+        if _FREEDOM_CONTAINER_MARKER in html_content:
+            # Parse HTML (plan components only)
+            soup = BeautifulSoup(html_content, _FAST_HTML_PARSER, parse_only=_FREEDOM_STRAINER)
+            plan_containers = soup.find_all(attrs={'data-testid': 'planComponent'})
         
         if not plan_containers:
             print("  ⚠️  No plan components found, returning cleaned HTML")
@@ -1161,36 +1473,20 @@ class AdvancedHTMLStripper:
         
         print(f"  ✅ Found {len(plan_containers)} plan components")
         
-        # Step 2: Deduplicate BEFORE removing attributes
+        # Step 2: Deduplicate plans
         unique_plans_data = AdvancedHTMLStripper._deduplicate_freedom_plans(plan_containers)
         print(f"  ✅ Deduplicated to {len(unique_plans_data)} unique plans")
         
-        # Step 3: Normalize BEFORE removing attributes
+        # Step 3: Normalize plans
         normalized_plans = []
         for plan_data in unique_plans_data:
-            normalized = AdvancedHTMLStripper._normalize_freedom_plan(plan_data['container'])
+            normalized = AdvancedHTMLStripper._normalize_freedom_plan(plan_data)
             if normalized:
                 normalized_plans.append(normalized)
         
         print(f"  ✅ Normalized {len(normalized_plans)} plans")
         
-        # Step 4-7: Remove noise
-        for tag in soup.find_all():
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('aria-')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-        
-        for sup in soup.find_all('sup'):
-            sup.decompose()
-        
-        for button in soup.find_all('button'):
-            button.decompose()
-        
-        for empty_div in soup.find_all('div'):
-            if not empty_div.get_text(strip=True) and len(empty_div.find_all()) == 0:
-                empty_div.decompose()
-        
-        # Step 8: Build final HTML
+        # Step 4: Build final HTML from normalized plans
         final_html = AdvancedHTMLStripper._build_final_html(normalized_plans)
         
         final_size = len(final_html)
@@ -1219,103 +1515,59 @@ class AdvancedHTMLStripper:
     @staticmethod
     def _deduplicate_freedom_plans(plan_containers: List) -> List[Dict[str, Any]]:
         """Deduplicate Freedom plan containers by (name, price, data_amount)"""
-        seen_keys = {}
+        seen_keys = set()
         unique_plans = []
         
         for container in plan_containers:
-            # Extract plan name from aria-label or plan-card test ID
-            plan_name = container.get('aria-label', '')
-            
-            # Fallback: extract from plan-card data-testid
-            if not plan_name:
-                plan_card = container.find(attrs={'data-testid': re.compile('plan-card-', re.I)})
-                if plan_card:
-                    testid = plan_card.get('data-testid', '')
-                    # Parse testid like "plan-card-10gb-5g" -> "10GB 5G+"
-                    # Format: plan-card-{data}{unit}-{network}
-                    match = re.match(r'plan-card-(\d+)(gb|mb)-?(\d+g|5g\+?|4g|lte)?', testid, re.I)
-                    if match:
-                        data_num = match.group(1)
-                        data_unit = match.group(2).upper()
-                        network = match.group(3) or ''
-                        
-                        # Format network (5g -> 5G+, 4g -> 4G, etc.)
-                        if network:
-                            network = network.upper()
-                            if network == '5G':
-                                network = '5G+'
-                        else:
-                            # Check container text for network info
-                            container_text = container.get_text()
-                            if re.search(r'5g\+?', container_text, re.I):
-                                network = '5G+'
-                            elif re.search(r'5g', container_text, re.I):
-                                network = '5G'
-                            elif re.search(r'4g|lte', container_text, re.I):
-                                network = '4G LTE'
-                        
-                        # Build formatted name: "10GB 5G+"
-                        if network:
-                            plan_name = f"{data_num}{data_unit} {network}"
-                        else:
-                            plan_name = f"{data_num}{data_unit}"
-                    else:
-                        # Fallback: try simple extraction
-                        name_match = re.search(r'plan-card-([^-]+(?:-[^-]+)?)', testid, re.I)
-                        if name_match:
-                            plan_name = name_match.group(1).replace('-', ' ').title()
-            
-            # Fallback: heuristic from headings
-            if not plan_name:
-                h_tags = container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                for h in h_tags:
-                    text = h.get_text(strip=True)
-                    if text and len(text) < 50 and not text.lower() in ['features', 'promotions', 'roaming']:
-                        plan_name = text
-                        break
+            # Full container text - shared by network detection, data and price extraction
+            text = container.get_text()
             
-            if not plan_name or len(plan_name) > 50:
-                plan_name = "Unknown"
+            # Extract plan name (aria-label -> plan-card test ID -> headings)
+            plan_name = AdvancedHTMLStripper._extract_freedom_plan_name(container, text)
             
             # Extract data amount
-            text = container.get_text()
-            data_match = re.search(r'(\d+)\s*GB', text, re.I)
+            data_match = _RE_GB.search(text)
             data_amount = data_match.group(0) if data_match else "unknown"
             
             # Extract price (handle formats: $34/month, 34/mo, $34/mo)
-            price_match = re.search(r'\$?(\d+(?:\.\d+)?)\s*(?:/|per)\s*mo(?:nth)?', text, re.I)
+            price_match = _RE_FREEDOM_PRICE.search(text)
             if price_match:
                 price = f"${price_match.group(1)}"
             else:
-                price_match = re.search(r'\$\d+(?:\.\d+)?', text)
+                price_match = _RE_DOLLAR.search(text)
                 price = price_match.group(0) if price_match else "unknown"
             
-            key = f"{plan_name}|{price}|{data_amount}"
+            key = (plan_name or "Unknown", price, data_amount)
             
             if key not in seen_keys:
-                seen_keys[key] = True
+                seen_keys.add(key)
                 unique_plans.append({
                     'container': container,
-                    'name': plan_name,
+                    'name': plan_name,  # None when no usable name was found
                     'price': price,
-                    'data': data_amount
+                    'data': data_amount,
+                    'text': text
                 })
         
         return unique_plans
     
     @staticmethod
-    def _normalize_freedom_plan(container) -> Optional[Dict[str, Any]]:
-        """Normalize a single Freedom plan container"""
-        # Extract plan name (same as deduplication)
+    def _extract_freedom_plan_name(container, text: str) -> Optional[str]:
+        """Plan name from aria-label, plan-card test ID or headings (None if not usable)
+        
+        text: container.get_text()
+        """
+        # Extract plan name from aria-label or plan-card test ID
         plan_name = container.get('aria-label', '')
         
+        # Fallback: extract from plan-card data-testid
         if not plan_name:
-            plan_card = container.find(attrs={'data-testid': re.compile('plan-card-', re.I)})
+            plan_card = container.find(attrs={'data-testid': _is_freedom_plan_card_testid})
             if plan_card:
                 testid = plan_card.get('data-testid', '')
                 # Parse testid like "plan-card-10gb-5g" -> "10GB 5G+"
                 # Format: plan-card-{data}{unit}-{network}
-                match = re.match(r'plan-card-(\d+)(gb|mb)-?(\d+g|5g\+?|4g|lte)?', testid, re.I)
+                match = _RE_PLAN_CARD_ID.match(testid)
                 if match:
                     data_num = match.group(1)
                     data_unit = match.group(2).upper()
@@ -1326,16 +1578,13 @@ class AdvancedHTMLStripper:
                         network = network.upper()
                         if network == '5G':
                             network = '5G+'
-                        elif network.endswith('G') and not network.endswith('G+'):
-                            network = network
                     else:
                         # Check container text for network info
-                        container_text = container.get_text()
-                        if re.search(r'5g\+?', container_text, re.I):
+                        if _RE_5G_PLUS.search(text):
                             network = '5G+'
-                        elif re.search(r'5g', container_text, re.I):
+                        elif _RE_5G.search(text):
                             network = '5G'
-                        elif re.search(r'4g|lte', container_text, re.I):
+                        elif _RE_4G_LTE.search(text):
                             network = '4G LTE'
                     
                     # Build formatted name: "10GB 5G+"
@@ -1345,33 +1594,34 @@ class AdvancedHTMLStripper:
                         plan_name = f"{data_num}{data_unit}"
                 else:
                     # Fallback: try simple extraction
-                    name_match = re.search(r'plan-card-([^-]+(?:-[^-]+)?)', testid, re.I)
+                    name_match = _RE_PLAN_CARD_NAME.search(testid)
                     if name_match:
                         plan_name = name_match.group(1).replace('-', ' ').title()
         
+        # Fallback: heuristic from headings
         if not plan_name:
-            h_tags = container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-            for h in h_tags:
-                text = h.get_text(strip=True)
-                if text and len(text) < 50 and text.lower() not in ['features', 'promotions', 'roaming']:
-                    plan_name = text
+            for h in AdvancedHTMLStripper._iter_headings(container):
+                heading = h.get_text(strip=True)
+                if heading and len(heading) < 50 and heading.lower() not in _FREEDOM_SECTION_HEADINGS:
+                    plan_name = heading
                     break
         
         if not plan_name or len(plan_name) > 50:
             return None
+        return plan_name
+    
+    @staticmethod
+    def _normalize_freedom_plan(plan_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Normalize a single Freedom plan from its deduplication record
         
-        # Extract price
-        text = container.get_text()
-        price_match = re.search(r'\$?(\d+(?:\.\d+)?)\s*(?:/|per)\s*mo(?:nth)?', text, re.I)
-        if price_match:
-            price = f"${price_match.group(1)}"
-        else:
-            price_match = re.search(r'\$\d+(?:\.\d+)?', text)
-            price = price_match.group(0) if price_match else "unknown"
-        
-        # Extract data amount
-        data_match = re.search(r'(\d+)\s*GB', text, re.I)
-        data_amount = data_match.group(0) if data_match else "unknown"
+        Name, price and data amount were already extracted by _deduplicate_freedom_plans
+        """
+        container = plan_data['container']
+        plan_name = plan_data['name']
+        if not plan_name:
+            return None
+        price = plan_data['price']
+        data_amount = plan_data['data']
         
         # Extract features from structured sections
         features = []
@@ -1385,9 +1635,7 @@ class AdvancedHTMLStripper:
         
         if feature_section:
             for li in feature_section.find_all('li'):
-                for sup in li.find_all('sup'):
-                    sup.decompose()
-                text = li.get_text(strip=True)
+                text = AdvancedHTMLStripper._text_without_sup(li, strip=True)
                 if text and len(text) > 5:
                     features.append(text)
         
@@ -1396,9 +1644,7 @@ class AdvancedHTMLStripper:
             for ul in container.find_all('ul'):
                 if len(ul.find_all('li')) >= 3:
                     for li in ul.find_all('li'):
-                        for sup in li.find_all('sup'):
-                            sup.decompose()
-                        text = li.get_text(strip=True)
+                        text = AdvancedHTMLStripper._text_without_sup(li, strip=True)
                         if text and len(text) > 5:
                             features.append(text)
                     break
@@ -1411,7 +1657,7 @@ class AdvancedHTMLStripper:
         }
     
     @staticmethod
-    def strip_koodo_html(html_content: str) -> Dict[str, Any]:
+    def strip_koodo_html(html_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Apply advanced stripping rules to Koodo HTML
         
@@ -1419,45 +1665,50 @@ class AdvancedHTMLStripper:
         1. Find plan groups (Canada Wide Plans, Starter Plans)
         2. Extract group name from each group
         3. Find plan tiles within each group
-        4. Deduplicate plans by (name, price, data_amount) - BEFORE attribute removal
-        5. Normalize plans - BEFORE attribute removal (include group name)
-        6. Remove all aria-* attributes
-        7. Remove all <sup> footnotes
-        8. Remove all <button> elements
-        9. Remove empty divs
-        10. Remove promotional text sections
-        11. Output minimal JSON-ready HTML
+        4. Deduplicate plans by (name, price, data_amount)
+        5. Normalize plans (include group name)
+        6. Output minimal JSON-ready HTML
+        
+        Only mfe-rate-plan-tile* subtrees are parsed; aria-* attributes, footnotes,
+        buttons and promo text never reach the output - it is rebuilt from the
+        normalized plans only.
         
         NO hardcoded plan names - constructs from data amount + speed, includes group name
         """
+        html_content = AdvancedHTMLStripper._decode_html(html_content)
         original_size = len(html_content)
         original_tokens = original_size // 4
         
         print("  🔍 Advanced Koodo stripping: Group-aware deduplication + semantic normalization...")
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # Step 1: Find plan groups (Koodo has "Canada Wide Plans" and "Starter Plans")
-        plan_groups = soup.find_all(attrs={'data-testid': re.compile('mfe-rate-plan-tile-group', re.I)})
-        # Filter to actual groups (not containers) - groups have pattern "mfe-rate-plan-tile-group-N"
-        plan_groups = [g for g in plan_groups if re.search(r'mfe-rate-plan-tile-group-\d+$', g.get('data-testid', ''))]
+        # Parse HTML (plan group/tile subtrees only)
+        soup = None
+        plan_groups = []
+        if _RE_KOODO_TILE_MARKER.search(html_content):
+            soup = BeautifulSoup(html_content, _FAST_HTML_PARSER, parse_only=_KOODO_STRAINER)
+            
+            # Step 1: Find plan groups (Koodo has "Canada Wide Plans" and "Starter Plans")
+            # Only actual groups (not containers) - groups have pattern "mfe-rate-plan-tile-group-N"
+            plan_groups = soup.find_all(attrs={'data-testid': _is_koodo_group_testid})
         
         if not plan_groups:
             print("  ⚠️  No plan groups found, trying fallback method...")
             # Fallback: find plan tiles directly
-            plan_tiles = soup.find_all(attrs={'data-testid': re.compile('mfe-rate-plan-tile', re.I)})
-            plan_tiles = [tile for tile in plan_tiles if 'group' not in tile.get('data-testid', '').lower() and 'container' in tile.get('data-testid', '').lower()]
+            plan_tiles = soup.find_all(attrs={'data-testid': _is_koodo_loose_tile_testid}) if soup is not None else []
             
             if not plan_tiles:
                 print("  ⚠️  No plan tiles found, returning cleaned HTML")
                 return AdvancedHTMLStripper._basic_fallback(html_content, original_size)
             
             print(f"  ✅ Found {len(plan_tiles)} plan tiles (fallback)")
+            tiles_before_dedup = len(plan_tiles)
             # Process without group context
-            unique_plans_data = AdvancedHTMLStripper._deduplicate_koodo_plans(plan_tiles)
+            unique_plans_data = AdvancedHTMLStripper._deduplicate_koodo_plans(
+                [{'tile': tile, 'group_name': None} for tile in plan_tiles]
+            )
             normalized_plans = []
             for plan_data in unique_plans_data:
-                normalized = AdvancedHTMLStripper._normalize_koodo_plan(plan_data['tile'], group_name=None)
+                normalized = AdvancedHTMLStripper._normalize_koodo_plan(plan_data)
                 if normalized:
                     normalized_plans.append(normalized)
         else:
@@ -1467,15 +1718,14 @@ class AdvancedHTMLStripper:
             all_plan_tiles_with_groups = []
             for group in plan_groups:
                 # Extract group name
-                group_name_elem = group.find(attrs={'data-testid': re.compile('mfe-rate-plan-group-name', re.I)})
+                group_name_elem = group.find(attrs={'data-testid': _is_koodo_group_name_testid})
                 group_name = group_name_elem.get_text(strip=True) if group_name_elem else "Unknown"
                 
                 # Find tiles container within this group
-                tiles_container = group.find(attrs={'data-testid': re.compile('mfe-rate-plan-tile-group-tiles-container', re.I)})
+                tiles_container = group.find(attrs={'data-testid': _is_koodo_tiles_container_testid})
                 if tiles_container:
                     # Find plan tiles in this container
-                    plan_tiles = tiles_container.find_all(attrs={'data-testid': re.compile('mfe-rate-plan-tile.*container', re.I)})
-                    plan_tiles = [t for t in plan_tiles if 'group' not in t.get('data-testid', '').lower()]
+                    plan_tiles = tiles_container.find_all(attrs={'data-testid': _is_koodo_group_tile_testid})
                     
                     print(f"    Group '{group_name}': {len(plan_tiles)} plans")
                     
@@ -1487,45 +1737,22 @@ class AdvancedHTMLStripper:
                         })
             
             print(f"  ✅ Total plan tiles: {len(all_plan_tiles_with_groups)}")
+            tiles_before_dedup = len(all_plan_tiles_with_groups)
             
-            # Step 3: Deduplicate BEFORE removing attributes (pass group context)
-            unique_plans_data = AdvancedHTMLStripper._deduplicate_koodo_plans_with_groups(all_plan_tiles_with_groups)
+            # Step 3: Deduplicate (pass group context)
+            unique_plans_data = AdvancedHTMLStripper._deduplicate_koodo_plans(all_plan_tiles_with_groups)
             print(f"  ✅ Deduplicated to {len(unique_plans_data)} unique plans")
             
-            # Step 4: Normalize BEFORE removing attributes (include group name)
+            # Step 4: Normalize (include group name)
             normalized_plans = []
             for plan_data in unique_plans_data:
-                normalized = AdvancedHTMLStripper._normalize_koodo_plan(plan_data['tile'], group_name=plan_data.get('group_name'))
+                normalized = AdvancedHTMLStripper._normalize_koodo_plan(plan_data)
                 if normalized:
                     normalized_plans.append(normalized)
             
             print(f"  ✅ Normalized {len(normalized_plans)} plans")
         
-        # Step 5-9: Remove noise
-        for tag in soup.find_all():
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('aria-')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-        
-        for sup in soup.find_all('sup'):
-            sup.decompose()
-        
-        for button in soup.find_all('button'):
-            button.decompose()
-        
-        for empty_div in soup.find_all('div'):
-            if not empty_div.get_text(strip=True) and len(empty_div.find_all()) == 0:
-                empty_div.decompose()
-        
-        # Remove promotional text
-        promo_texts = ['Promotion', 'Pick 1 FREE Perk', 'Price includes savings', 'See details']
-        for promo_text in promo_texts:
-            for elem in soup.find_all(string=re.compile(re.escape(promo_text), re.I)):
-                parent = elem.find_parent()
-                if parent:
-                    parent.decompose()
-        
-        # Step 9: Build final HTML
+        # Step 5: Build final HTML from normalized plans
         final_html = AdvancedHTMLStripper._build_final_html(normalized_plans)
         
         final_size = len(final_html)
@@ -1546,72 +1773,84 @@ class AdvancedHTMLStripper:
                 'tokens_saved': tokens_saved,
                 'reduction_percent': round(reduction, 2),
                 'plan_count': len(normalized_plans),
-                'tiles_before_dedup': len(plan_tiles),
+                'tiles_before_dedup': tiles_before_dedup,
                 'tiles_after_dedup': len(unique_plans_data)
             }
         }
     
     @staticmethod
-    def _deduplicate_koodo_plans_with_groups(plan_tiles_with_groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Deduplicate Koodo plan tiles by (name, price, data_amount) with group context"""
-        seen_keys = {}
+    def _extract_koodo_data_and_price(tile) -> Tuple[str, str]:
+        """(data_amount, price) for a Koodo tile from its data-bucket / price-lockup test IDs, falling back to tile text"""
+        text = None  # tile.get_text(), computed at most once and only if a fallback needs it
+        
+        # Extract data amount and speed from data-testid elements
+        data_amount_elem = tile.find(attrs={'data-testid': _is_koodo_data_amount_testid})
+        data_speed_elem = tile.find(attrs={'data-testid': _is_koodo_data_speed_testid})
+        data_speed_allowance = tile.find(attrs={'data-testid': _is_koodo_speed_allowance_testid})
+        
+        data_amount = "unknown"
+        speed_text = ""
+        
+        if data_amount_elem:
+            amount = data_amount_elem.get_text(strip=True)
+            if speed_allowance := (data_speed_allowance or data_speed_elem):
+                speed_text = speed_allowance.get_text(strip=True)
+            # Construct data string like "110 GB" or "110 GB at 5G Speed"
+            if speed_text and 'Speed' in speed_text:
+                # Extract speed from text like "at 5G Speed"
+                speed_match = _RE_KOODO_SPEED.search(speed_text)
+                if speed_match:
+                    data_amount = f"{amount} GB at {speed_match.group(1)} Speed"
+                else:
+                    data_amount = f"{amount} GB {speed_text}"
+            else:
+                data_amount = f"{amount} GB" if amount.isdigit() else amount
+        
+        # Fallback: extract from text if data-testid not found
+        if data_amount == "unknown":
+            text = tile.get_text()
+            data_match = _RE_KOODO_DATA.search(text)
+            data_amount = data_match.group(0) if data_match else "unknown"
+        
+        # Extract price from plan-price-lockup
+        price = "unknown"
+        price_elem = tile.find(attrs={'data-testid': _is_koodo_price_lockup_testid})
+        if price_elem:
+            price_text = price_elem.get_text(strip=True)
+            price_match = _RE_DOLLAR_AMOUNT.search(price_text)
+            if price_match:
+                price = f"${price_match.group(1)}"
+        
+        # Fallback: extract from text
+        if price == "unknown":
+            if text is None:
+                text = tile.get_text()
+            price_match = _RE_DOLLAR_AMOUNT.search(text)
+            if price_match:
+                price = f"${price_match.group(1)}"
+        
+        return data_amount, price
+    
+    @staticmethod
+    def _deduplicate_koodo_plans(plan_tiles_with_groups: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Deduplicate Koodo plan tiles by (group, data_amount, price)
+        
+        group_name is None for tiles found without a plan group
+        """
+        seen_keys = set()
         unique_plans = []
         
         for item in plan_tiles_with_groups:
             tile = item['tile']
             group_name = item.get('group_name', 'Unknown')
-            
-            # Extract data amount and speed from data-testid elements (BEFORE attribute removal)
-            data_amount_elem = tile.find(attrs={'data-testid': re.compile('data-bucket-amount', re.I)})
-            data_speed_elem = tile.find(attrs={'data-testid': re.compile('data-bucket-speed', re.I)})
-            data_speed_allowance = tile.find(attrs={'data-testid': re.compile('data-bucket-speedAllowance', re.I)})
-            
-            data_amount = "unknown"
-            speed_text = ""
-            
-            if data_amount_elem:
-                amount = data_amount_elem.get_text(strip=True)
-                if speed_allowance := (data_speed_allowance or data_speed_elem):
-                    speed_text = speed_allowance.get_text(strip=True)
-                # Construct data string like "110 GB" or "110 GB at 5G Speed"
-                if speed_text and 'Speed' in speed_text:
-                    # Extract speed from text like "at 5G Speed"
-                    speed_match = re.search(r'at\s+(\d+G(?:\+)?)\s+Speed', speed_text, re.I)
-                    if speed_match:
-                        data_amount = f"{amount} GB at {speed_match.group(1)} Speed"
-                    else:
-                        data_amount = f"{amount} GB {speed_text}"
-                else:
-                    data_amount = f"{amount} GB" if amount.isdigit() else amount
-            
-            # Fallback: extract from text if data-testid not found
-            if data_amount == "unknown":
-                text = tile.get_text()
-                data_match = re.search(r'(\d+)\s*GB(?:\s+at\s+\d+G(?:\+)?\s+Speed)?', text, re.I)
-                data_amount = data_match.group(0) if data_match else "unknown"
-            
-            # Extract price from plan-price-lockup (BEFORE attribute removal)
-            price = "unknown"
-            price_elem = tile.find(attrs={'data-testid': re.compile('plan-price-lockup', re.I)})
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                price_match = re.search(r'\$(\d+(?:\.\d+)?)', price_text)
-                if price_match:
-                    price = f"${price_match.group(1)}"
-            
-            # Fallback: extract from text
-            if price == "unknown":
-                text = tile.get_text()
-                price_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:per\s*month)?', text, re.I)
-                if price_match:
-                    price = f"${price_match.group(1)}"
+            data_amount, price = AdvancedHTMLStripper._extract_koodo_data_and_price(tile)
             
             # Create deduplication key (use data + price + group since plans can exist in multiple groups)
             # Include group name in key to differentiate same plan in different groups
-            key = f"{group_name}|{data_amount}|{price}"
+            key = (group_name, data_amount, price)
             
             if key not in seen_keys:
-                seen_keys[key] = True
+                seen_keys.add(key)
                 unique_plans.append({
                     'tile': tile,
                     'name': data_amount if data_amount != "unknown" else "Unknown",
@@ -1623,106 +1862,14 @@ class AdvancedHTMLStripper:
         return unique_plans
     
     @staticmethod
-    def _deduplicate_koodo_plans(plan_tiles: List) -> List[Dict[str, Any]]:
-        """Deduplicate Koodo plan tiles by (name, price, data_amount)"""
-        seen_keys = {}
-        unique_plans = []
-        
-        for tile in plan_tiles:
-            # Extract data amount and speed from data-testid elements (BEFORE attribute removal)
-            data_amount_elem = tile.find(attrs={'data-testid': re.compile('data-bucket-amount', re.I)})
-            data_speed_elem = tile.find(attrs={'data-testid': re.compile('data-bucket-speed', re.I)})
-            data_speed_allowance = tile.find(attrs={'data-testid': re.compile('data-bucket-speedAllowance', re.I)})
-            
-            data_amount = "unknown"
-            speed_text = ""
-            
-            if data_amount_elem:
-                amount = data_amount_elem.get_text(strip=True)
-                if speed_allowance := (data_speed_allowance or data_speed_elem):
-                    speed_text = speed_allowance.get_text(strip=True)
-                # Construct data string like "110 GB" or "110 GB at 5G Speed"
-                if speed_text and 'Speed' in speed_text:
-                    # Extract speed from text like "at 5G Speed"
-                    speed_match = re.search(r'at\s+(\d+G(?:\+)?)\s+Speed', speed_text, re.I)
-                    if speed_match:
-                        data_amount = f"{amount} GB at {speed_match.group(1)} Speed"
-                    else:
-                        data_amount = f"{amount} GB {speed_text}"
-                else:
-                    data_amount = f"{amount} GB" if amount.isdigit() else amount
-            
-            # Fallback: extract from text if data-testid not found
-            if data_amount == "unknown":
-                text = tile.get_text()
-                data_match = re.search(r'(\d+)\s*GB(?:\s+at\s+\d+G(?:\+)?\s+Speed)?', text, re.I)
-                data_amount = data_match.group(0) if data_match else "unknown"
-            
-            # Extract price from plan-price-lockup (BEFORE attribute removal)
-            price = "unknown"
-            price_elem = tile.find(attrs={'data-testid': re.compile('plan-price-lockup', re.I)})
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                price_match = re.search(r'\$(\d+(?:\.\d+)?)', price_text)
-                if price_match:
-                    price = f"${price_match.group(1)}"
-            
-            # Fallback: extract from text
-            if price == "unknown":
-                text = tile.get_text()
-                price_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:per\s*month)?', text, re.I)
-                if price_match:
-                    price = f"${price_match.group(1)}"
-            
-            # Construct plan name from data + speed (Koodo doesn't have explicit plan names)
-            # Format: "110 GB at 5G Speed" or "110 GB"
-            plan_name = data_amount if data_amount != "unknown" else "Unknown"
-            
-            # Create deduplication key (use data + price since plan names are constructed)
-            key = f"{plan_name}|{price}"
-            
-            if key not in seen_keys:
-                seen_keys[key] = True
-                unique_plans.append({
-                    'tile': tile,
-                    'name': plan_name,
-                    'price': price,
-                    'data': data_amount
-                })
-        
-        return unique_plans
-    
-    @staticmethod
-    def _normalize_koodo_plan(tile, group_name: str = None) -> Optional[Dict[str, Any]]:
-        """Normalize a single Koodo plan tile, optionally including group name"""
-        # Extract data amount and speed from data-testid elements (BEFORE attribute removal)
-        data_amount_elem = tile.find(attrs={'data-testid': re.compile('data-bucket-amount', re.I)})
-        data_speed_elem = tile.find(attrs={'data-testid': re.compile('data-bucket-speed', re.I)})
-        data_speed_allowance = tile.find(attrs={'data-testid': re.compile('data-bucket-speedAllowance', re.I)})
-        
-        data_amount = "unknown"
-        speed_text = ""
-        
-        if data_amount_elem:
-            amount = data_amount_elem.get_text(strip=True)
-            if speed_allowance := (data_speed_allowance or data_speed_elem):
-                speed_text = speed_allowance.get_text(strip=True)
-            
-            # Construct data string
-            if speed_text and 'Speed' in speed_text:
-                speed_match = re.search(r'at\s+(\d+G(?:\+)?)\s+Speed', speed_text, re.I)
-                if speed_match:
-                    data_amount = f"{amount} GB at {speed_match.group(1)} Speed"
-                else:
-                    data_amount = f"{amount} GB {speed_text}"
-            else:
-                data_amount = f"{amount} GB" if amount.isdigit() else amount
+    def _normalize_koodo_plan(plan_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Normalize a single Koodo plan from its deduplication record, including its group name
         
-        # Fallback: extract from text
-        if data_amount == "unknown":
-            text = tile.get_text()
-            data_match = re.search(r'(\d+)\s*GB(?:\s+at\s+\d+G(?:\+)?\s+Speed)?', text, re.I)
-            data_amount = data_match.group(0) if data_match else "unknown"
+        Data amount and price were already extracted by _deduplicate_koodo_plans
+        """
+        tile = plan_data['tile']
+        group_name = plan_data.get('group_name')
+        data_amount = plan_data['data']
         
         # Construct plan name from data amount (Koodo doesn't have explicit plan names)
         # Include group name if provided (e.g., "Canada Wide Plans - 110 GB at 5G Speed")
@@ -1734,56 +1881,30 @@ class AdvancedHTMLStripper:
         if plan_name == "Unknown" or (plan_name.endswith("Unknown") and " - " not in plan_name):
             return None
         
-        # Extract price from plan-price-lockup (BEFORE attribute removal)
-        price = "unknown"
-        price_elem = tile.find(attrs={'data-testid': re.compile('plan-price-lockup', re.I)})
-        if price_elem:
-            price_text = price_elem.get_text(strip=True)
-            price_match = re.search(r'\$(\d+(?:\.\d+)?)', price_text)
-            if price_match:
-                price = f"${price_match.group(1)}"
-        
-        # Fallback: extract from text
-        if price == "unknown":
-            text = tile.get_text()
-            price_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:per\s*month)?', text, re.I)
-            if price_match:
-                price = f"${price_match.group(1)}"
+        price = plan_data['price']
         
         # Extract features from data-testid="mfe-rate-plan-allowance-description"
         features = []
-        allowances = tile.find_all(attrs={'data-testid': re.compile('mfe-rate-plan-allowance-description', re.I)})
+        allowances = tile.find_all(attrs={'data-testid': _is_koodo_allowance_testid})
         
         for allowance in allowances:
-            # Remove superscripts before extracting text
-            from copy import copy
-            allowance_copy = copy(allowance)
-            for sup in allowance_copy.find_all('sup'):
-                sup.decompose()
-            
-            # Get text and normalize spacing
-            text = allowance_copy.get_text(separator=' ', strip=True)
-            # Fix spacing issues (e.g., "10GBof" -> "10GB of")
-            text = re.sub(r'(\d+GB)([A-Za-z])', r'\1 \2', text, flags=re.I)
-            text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-            text = re.sub(r'\s+', ' ', text).strip()
+            # Get text without superscripts and normalize spacing
+            text = AdvancedHTMLStripper._text_without_sup(allowance, ' ', strip=True)
+            # Fix spacing issues (e.g., "10GBof" -> "10GB of"), then collapse whitespace
+            text = ' '.join(_RE_GLUED_WORD_BOUNDARY.sub(' ', text).split())
             
             if text and len(text) > 5:
                 # Skip if it's just the data amount (already captured)
-                if not re.match(r'^\d+\s*GB', text, re.I):
+                if not _RE_LEADING_GB.match(text):
                     features.append(text)
         
         # If no features found via data-testid, try ul/li fallback
         if not features:
             for ul in tile.find_all('ul'):
                 for li in ul.find_all('li'):
-                    for sup in li.find_all('sup'):
-                        sup.decompose()
-                    text = li.get_text(separator=' ', strip=True)
+                    text = AdvancedHTMLStripper._text_without_sup(li, ' ', strip=True)
                     # Normalize spacing
-                    text = re.sub(r'(\d+GB)([A-Za-z])', r'\1 \2', text, flags=re.I)
-                    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
-                    text = re.sub(r'\s+', ' ', text).strip()
+                    text = ' '.join(_RE_GLUED_WORD_BOUNDARY.sub(' ', text).split())
                     if text and len(text) > 5:
                         features.append(text)
                 if features:
@@ -1797,57 +1918,59 @@ class AdvancedHTMLStripper:
         }
     
     @staticmethod
-    def strip_fido_html(html_content: str) -> Dict[str, Any]:
+    def strip_fido_html(html_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Apply advanced stripping rules to Fido HTML
         
         Steps:
         1. Find plan containers by finding spans with plan names, then their parent containers
-        2. Deduplicate plans by (name, price, data_amount) - BEFORE attribute removal
-        3. Normalize plans - BEFORE attribute removal
-        4. Remove all aria-* attributes
-        5. Remove all <sup> footnotes
-        6. Remove all <button> elements
-        7. Remove empty divs
-        8. Remove promotional text ("Get $X off", "View more benefits")
-        9. Output minimal JSON-ready HTML
+        2. Deduplicate plans by (name, price, data_amount)
+        3. Normalize plans to minimal semantic structure
+        4. Output minimal JSON-ready HTML
+        
+        aria-* attributes, footnotes, buttons and promo text ("Get $X off",
+        "View more benefits") never reach the output - it is rebuilt from the
+        normalized plans only.
         
         NO hardcoded plan names - uses span.text-title-5 for plan names
         """
+        html_content = AdvancedHTMLStripper._decode_html(html_content)
         original_size = len(html_content)
         original_tokens = original_size // 4
         
         print("  🔍 Advanced Fido stripping: Deduplication + semantic normalization...")
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse HTML without script/style/noscript payloads
+        soup = BeautifulSoup(_RE_NON_CONTENT_BLOCK.sub('', html_content), _FAST_HTML_PARSER)
         
         # Step 1: Find plan containers by finding plan name spans, then walking up to ancestor with price
         # Generic rule: For each plan name span, find closest ancestor that contains a ds-price element
-        plan_name_spans = soup.find_all('span', class_=re.compile('text-title-5', re.I))
+        plan_name_spans = [tag for tag in soup.descendants if _is_fido_title_span(tag)]
         
         plan_containers = []
+        # id(ancestor) -> whether it contains a ds-price element; sibling spans share ancestors
+        has_price: Dict[int, bool] = {}
         for span in plan_name_spans:
             plan_name = span.get_text(strip=True)
             # Check if this looks like a plan name (generic patterns, not specific names)
             if 'BYOP' in plan_name or 'Talk & Text' in plan_name or 'GB' in plan_name or 'Complete' in plan_name:
                 # Generic rule: Walk up ancestor tree to find container with ds-price element
                 # This works regardless of DOM structure depth
-                current = span
                 found_container = None
-                
-                for level in range(6):  # Limit depth to prevent infinite loops
-                    parent = current.find_parent(['div', 'article', 'section'])
-                    if not parent:
-                        break
-                    
-                    # Check if this ancestor contains a ds-price element (generic class pattern)
-                    price_elem = parent.find(class_=re.compile('ds-price', re.I))
-                    if price_elem:
-                        # This ancestor has both the plan name span AND a price element
-                        found_container = parent
-                        break
-                    
-                    current = parent
+                checked = 0
+                node = span.parent
+                while node is not None and checked < 6:  # Check at most 6 div/article/section ancestors
+                    if node.name in _FIDO_CONTAINER_TAGS:
+                        # Check if this ancestor contains a ds-price element (generic class pattern)
+                        contains_price = has_price.get(id(node))
+                        if contains_price is None:
+                            contains_price = has_price[id(node)] = node.find(class_=_RE_FIDO_PRICE_CLASS) is not None
+                        if contains_price:
+                            # This ancestor has both the plan name span AND a price element
+                            found_container = node
+                            break
+                        checked += 1
+                    node = node.parent
                 
                 if found_container:
                     plan_containers.append(found_container)
@@ -1858,44 +1981,20 @@ class AdvancedHTMLStripper:
         
         print(f"  ✅ Found {len(plan_containers)} plan containers")
         
-        # Step 2: Deduplicate BEFORE removing attributes
+        # Step 2: Deduplicate plans
         unique_plans_data = AdvancedHTMLStripper._deduplicate_fido_plans(plan_containers)
         print(f"  ✅ Deduplicated to {len(unique_plans_data)} unique plans")
         
-        # Step 3: Normalize BEFORE removing attributes
+        # Step 3: Normalize plans
         normalized_plans = []
         for plan_data in unique_plans_data:
-            normalized = AdvancedHTMLStripper._normalize_fido_plan(plan_data['container'])
+            normalized = AdvancedHTMLStripper._normalize_fido_plan(plan_data)
             if normalized:
                 normalized_plans.append(normalized)
         
         print(f"  ✅ Normalized {len(normalized_plans)} plans")
         
-        # Step 4-8: Remove noise
-        for tag in soup.find_all():
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('aria-')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-        
-        for sup in soup.find_all('sup'):
-            sup.decompose()
-        
-        for button in soup.find_all('button'):
-            button.decompose()
-        
-        for empty_div in soup.find_all('div'):
-            if not empty_div.get_text(strip=True) and len(empty_div.find_all()) == 0:
-                empty_div.decompose()
-        
-        # Remove promotional text
-        promo_texts = ['Get $', 'off per month', 'View more benefits', 'Automatic Payments Discount']
-        for promo_text in promo_texts:
-            for elem in soup.find_all(string=re.compile(re.escape(promo_text), re.I)):
-                parent = elem.find_parent()
-                if parent:
-                    parent.decompose()
-        
-        # Step 9: Build final HTML
+        # Step 4: Build final HTML from normalized plans
         final_html = AdvancedHTMLStripper._build_final_html(normalized_plans)
         
         final_size = len(final_html)
@@ -1924,61 +2023,45 @@ class AdvancedHTMLStripper:
     @staticmethod
     def _deduplicate_fido_plans(plan_containers: List) -> List[Dict[str, Any]]:
         """Deduplicate Fido plan containers by (name, price, data_amount)"""
-        seen_keys = {}
+        seen_keys = set()
         unique_plans = []
         
         for container in plan_containers:
-            # Extract plan name from span.text-title-5 first (Fido structure)
-            plan_name = None
-            plan_name_span = container.find('span', class_=re.compile('text-title-5', re.I))
-            if plan_name_span:
-                plan_name = plan_name_span.get_text(strip=True)
-                # Remove "- BYOP Plan" suffix if present
-                plan_name = plan_name.replace('- BYOP Plan', '').strip()
-            
-            # Fallback: Extract plan name from headings
-            if not plan_name:
-                for h in container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                    text = h.get_text(strip=True)
-                    if text and len(text) < 50 and '- BYOP Plan' not in text:
-                        plan_name = text.replace('- BYOP Plan', '').strip()
-                        break
-            
-            if not plan_name or len(plan_name) > 50:
-                plan_name = "Unknown"
+            plan_name = AdvancedHTMLStripper._extract_fido_plan_name(container)
             
             # Extract data amount
             text = container.get_text()
-            data_match = re.search(r'(\d+)\s*GB', text, re.I)
+            data_match = _RE_GB.search(text)
             data_amount = data_match.group(0) if data_match else "unknown"
             
             # Extract price (format: "$30.00 per mo." or "$30.00 /mo.")
-            price_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:per\s*mo|/mo)', text, re.I)
+            price_match = _RE_FIDO_MONTHLY_PRICE.search(text)
             if price_match:
                 price = f"${price_match.group(1)}"
             else:
-                price_match = re.search(r'\$\d+(?:\.\d+)?', text)
+                price_match = _RE_DOLLAR.search(text)
                 price = price_match.group(0) if price_match else "unknown"
             
-            key = f"{plan_name}|{price}|{data_amount}"
+            key = (plan_name or "Unknown", price, data_amount)
             
             if key not in seen_keys:
-                seen_keys[key] = True
+                seen_keys.add(key)
                 unique_plans.append({
                     'container': container,
-                    'name': plan_name,
+                    'name': plan_name,  # None when no usable name was found
                     'price': price,
-                    'data': data_amount
+                    'data': data_amount,
+                    'text': text
                 })
         
         return unique_plans
     
     @staticmethod
-    def _normalize_fido_plan(container) -> Optional[Dict[str, Any]]:
-        """Normalize a single Fido plan container"""
+    def _extract_fido_plan_name(container) -> Optional[str]:
+        """Plan name from span.text-title-5 or headings, without "- BYOP Plan" (None if not usable)"""
         # Extract plan name from span.text-title-5 first (Fido structure)
         plan_name = None
-        plan_name_span = container.find('span', class_=re.compile('text-title-5', re.I))
+        plan_name_span = next((tag for tag in container.descendants if _is_fido_title_span(tag)), None)
         if plan_name_span:
             plan_name = plan_name_span.get_text(strip=True)
             # Remove "- BYOP Plan" suffix if present
@@ -1986,7 +2069,7 @@ class AdvancedHTMLStripper:
         
         # Fallback: Extract plan name from headings
         if not plan_name:
-            for h in container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+            for h in AdvancedHTMLStripper._iter_headings(container):
                 text = h.get_text(strip=True)
                 if text and len(text) < 50 and '- BYOP Plan' not in text:
                     plan_name = text.replace('- BYOP Plan', '').strip()
@@ -1994,36 +2077,43 @@ class AdvancedHTMLStripper:
         
         if not plan_name or len(plan_name) > 50:
             return None
+        return plan_name
+    
+    @staticmethod
+    def _normalize_fido_plan(plan_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Normalize a single Fido plan from its deduplication record
+        
+        Name, data amount and container text were already extracted by _deduplicate_fido_plans
+        """
+        container = plan_data['container']
+        plan_name = plan_data['name']
+        if not plan_name:
+            return None
         
-        # Get container text for all extractions
-        text = container.get_text()
+        container_text = plan_data['text']  # container.get_text() from deduplication
         
         # Extract price - first try ds-price element (more reliable)
         price = "unknown"
-        price_elem = container.find(class_=re.compile('ds-price', re.I))
+        price_elem = container.find(class_=_RE_FIDO_PRICE_CLASS)
         if price_elem:
             price_text = price_elem.get_text(strip=True)
             # Extract from ds-price element (format: "$30.00 per mo." or "$30.00 /mo.")
-            price_match = re.search(r'\$(\d+(?:\.\d+)?)', price_text)
+            price_match = _RE_DOLLAR_AMOUNT.search(price_text)
             if price_match:
                 price = f"${price_match.group(1)}"
         
         # Fallback: regex on container text
         if price == "unknown":
-            price_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:per\s*mo|/mo)', text, re.I)
+            price_match = _RE_FIDO_MONTHLY_PRICE.search(container_text)
             price = f"${price_match.group(1)}" if price_match else "unknown"
         
-        # Extract data amount
-        data_match = re.search(r'(\d+)\s*GB', text, re.I)
-        data_amount = data_match.group(0) if data_match else "unknown"
+        data_amount = plan_data['data']
         
         # Extract features
         features = []
         for ul in container.find_all('ul'):
             for li in ul.find_all('li'):
-                for sup in li.find_all('sup'):
-                    sup.decompose()
-                text = li.get_text(strip=True)
+                text = AdvancedHTMLStripper._text_without_sup(li, strip=True)
                 if text and len(text) > 5:
                     features.append(text)
             if features:
@@ -2037,42 +2127,46 @@ class AdvancedHTMLStripper:
         }
     
     @staticmethod
-    def strip_virgin_html(html_content: str) -> Dict[str, Any]:
+    def strip_virgin_html(html_content: Union[str, bytes]) -> Dict[str, Any]:
         """
         Apply advanced stripping rules to Virgin HTML
         
         Steps:
         1. Find plan containers - use heuristic (divs with price + data)
-        2. Deduplicate plans by (name, price, data_amount) - BEFORE attribute removal
-        3. Normalize plans - BEFORE attribute removal
-        4. Remove navigation/header/footer
-        5. Remove all aria-* attributes
-        6. Remove all <sup> footnotes
-        7. Remove all <button> elements
-        8. Remove empty divs
-        9. Remove promotional/warning text sections
-        10. Output minimal JSON-ready HTML
+        2. Deduplicate plans by (name, price, data_amount)
+        3. Normalize plans to minimal semantic structure
+        4. Output minimal JSON-ready HTML
+        
+        Navigation/header/footer, aria-* attributes, footnotes, buttons and
+        promo/warning text never reach the output - it is rebuilt from the
+        normalized plans only.
         
         NO hardcoded plan names - uses headings or heuristic extraction
         Virgin uses AngularJS and may not have data-testid attributes in stripped HTML
         """
+        html_content = AdvancedHTMLStripper._decode_html(html_content)
         original_size = len(html_content)
         original_tokens = original_size // 4
         
         print("  🔍 Advanced Virgin stripping: Deduplication + semantic normalization...")
         
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Parse HTML without script/style/noscript payloads
+        content = _RE_NON_CONTENT_BLOCK.sub('', html_content)
         
         # Step 1: Find plan containers - first try plan-container elements, then fall back to heuristic
         plan_containers = []
         
         # Primary method: Look for <plan-container> elements (Angular custom elements)
-        plan_container_elements = soup.find_all('plan-container')
+        # Only their subtrees are parsed; the heuristic below needs the full document
+        plan_container_elements = []
+        if _RE_VIRGIN_PLAN_CONTAINER_MARKER.search(content):
+            soup = BeautifulSoup(content, _FAST_HTML_PARSER, parse_only=_VIRGIN_STRAINER)
+            plan_container_elements = soup.find_all('plan-container')
         if plan_container_elements:
             print(f"  ✅ Found {len(plan_container_elements)} plan-container elements")
             # For each plan-container, find the inner div with class "plan"
             for pc in plan_container_elements:
-                plan_div = pc.find('div', class_=re.compile(r'\bplan\b'))
+                plan_div = next((tag for tag in pc.descendants if _is_virgin_plan_div(tag)), None)
                 if plan_div:
                     plan_containers.append(plan_div)
                 else:
@@ -2082,19 +2176,22 @@ class AdvancedHTMLStripper:
         # Fallback: If no plan-container elements found, use heuristic (divs containing price and optionally data)
         if not plan_containers:
             print("  ⚠️  No plan-container elements found, using heuristic method")
+            soup = BeautifulSoup(content, _FAST_HTML_PARSER)
             all_divs = soup.find_all('div')
             
             for div in all_divs:
                 text = div.get_text(strip=True)
-                has_price = bool(re.search(r'\$\d+', text))
+                # Cheap checks first: reasonable size, then a '$' before the price regex
+                if not 100 < len(text) < 3000 or '$' not in text or not _RE_VIRGIN_PRICE_HINT.search(text):
+                    continue
                 # Look for GB, MB, or "pay per use" / "talk and text" patterns
-                has_data = bool(re.search(r'\d+\s*(GB|MB)', text, re.I) or 
-                               re.search(r'(pay\s*per\s*use|talk\s*and\s*text)', text, re.I))
+                has_data = bool(_RE_VIRGIN_DATA.search(text) or _RE_VIRGIN_PAY_OR_TALK.search(text))
                 
-                # Check if it looks like a plan container (has price, and optionally data, and reasonable size)
-                if has_price and (has_data or re.search(r'(talk\s*and\s*text|basic)', text, re.I)) and 100 < len(text) < 3000:
+                # Check if it looks like a plan container (has price, and optionally data)
+                if has_data or _RE_VIRGIN_TALK_OR_BASIC.search(text):
                     # Skip if it's a large container (likely page wrapper)
-                    parent_text = div.find_parent().get_text() if div.find_parent() else ""
+                    parent = div.parent
+                    parent_text = parent.get_text() if parent is not None else ""
                     if len(parent_text) < 10000:  # Reasonable parent size
                         plan_containers.append(div)
         
@@ -2104,47 +2201,16 @@ class AdvancedHTMLStripper:
         
         print(f"  ✅ Found {len(plan_containers)} plan containers")
         
-        # Step 2: Deduplicate BEFORE removing attributes
+        # Step 2: Deduplicate
         unique_plans_data = AdvancedHTMLStripper._deduplicate_virgin_plans(plan_containers)
         print(f"  ✅ Deduplicated to {len(unique_plans_data)} unique plans")
         
-        # Step 3: Normalize BEFORE removing attributes
-        normalized_plans = []
-        for plan_data in unique_plans_data:
-            normalized = AdvancedHTMLStripper._normalize_virgin_plan(plan_data['container'])
-            if normalized:
-                normalized_plans.append(normalized)
+        # Step 3: Normalize
+        normalized_plans = [AdvancedHTMLStripper._normalize_virgin_plan(plan_data) for plan_data in unique_plans_data]
         
         print(f"  ✅ Normalized {len(normalized_plans)} plans")
         
-        # Step 4-9: Remove noise
-        for tag in soup.find_all(['nav', 'header', 'footer']):
-            tag.decompose()
-        
-        for tag in soup.find_all():
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('aria-')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-        
-        for sup in soup.find_all('sup'):
-            sup.decompose()
-        
-        for button in soup.find_all('button'):
-            button.decompose()
-        
-        for empty_div in soup.find_all('div'):
-            if not empty_div.get_text(strip=True) and len(empty_div.find_all()) == 0:
-                empty_div.decompose()
-        
-        # Remove promotional/warning text
-        promo_texts = ['Warning Msg Title', 'Skip to', 'Find a store', 'Book an appointment', 'Log in']
-        for promo_text in promo_texts:
-            for elem in soup.find_all(string=re.compile(re.escape(promo_text), re.I)):
-                parent = elem.find_parent()
-                if parent:
-                    parent.decompose()
-        
-        # Step 10: Build final HTML
+        # Step 4: Build final HTML
         final_html = AdvancedHTMLStripper._build_final_html(normalized_plans)
         
         final_size = len(final_html)
@@ -2173,58 +2239,67 @@ class AdvancedHTMLStripper:
     @staticmethod
     def _deduplicate_virgin_plans(plan_containers: List) -> List[Dict[str, Any]]:
         """Deduplicate Virgin plan containers by (name, price, data_amount)"""
-        seen_keys = {}
+        seen_names: Dict[Tuple[str, ...], str] = {}  # dedup key -> name of the plan that claimed it
+        seen_containers = set()  # id() of containers already extracted
         unique_plans = []
         
         for container in plan_containers:
+            # Nested <plan-container>s can resolve to the same plan div - it would yield the same key again
+            if id(container) in seen_containers:
+                continue
+            seen_containers.add(id(container))
+            
+            container_text = None  # container.get_text(), computed at most once and only if a fallback needs it
+            
             # First, try to extract price from accss-monthlyPrice element (most reliable)
             price = "unknown"
-            price_elem = container.find(id=re.compile(r'accss-monthlyPrice-', re.I))
+            price_elem = container.find(id=_RE_VIRGIN_MONTHLY_PRICE_ID)
             if price_elem:
                 price_text = price_elem.get_text(strip=True)
-                price_match = re.search(r'\$(\d+(?:\.\d+)?)', price_text)
+                price_match = _RE_DOLLAR_AMOUNT.search(price_text)
                 if price_match:
                     price = f"${price_match.group(1)}"
             
             # If no price from ID, try to find it in the container text
             if price == "unknown":
-                text = container.get_text()
-                price_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:/|per)\s*mo', text, re.I)
+                container_text = container.get_text()
+                price_match = _RE_VIRGIN_MONTHLY_PRICE.search(container_text)
                 if price_match:
                     price = f"${price_match.group(1)}"
                 else:
-                    price_match = re.search(r'\$\d+(?:\.\d+)?', text)
+                    price_match = _RE_DOLLAR.search(container_text)
                     price = price_match.group(0) if price_match else "unknown"
             
             # Extract data amount from plan.planFeatures.RP_DATA.Desc span (most reliable)
             data_amount = "unknown"
-            data_span = container.find('span', class_=re.compile(r'planFeatures|RP_DATA', re.I))
+            data_span = next((tag for tag in container.descendants if _is_virgin_data_span(tag)), None)
             if not data_span:
-                # Try finding span with data description
-                for span in container.find_all('span'):
+                # Try finding span with data description (lazily - stops at the first match)
+                for span in (tag for tag in container.descendants if tag.name == 'span'):
                     span_text = span.get_text(strip=True)
-                    if re.search(r'\d+\s*(GB|MB)', span_text, re.I) or 'talk' in span_text.lower():
+                    if _RE_VIRGIN_DATA.search(span_text) or 'talk' in span_text.lower():
                         data_span = span
                         break
             
             if data_span:
                 data_text = data_span.get_text(strip=True)
                 # Look for patterns like "10GB data, talk & text", "40GB data, talk & text", "Talk and text", "250MB data, talk & text"
-                data_match = re.search(r'(\d+)\s*(GB|MB)', data_text, re.I)
+                data_match = _RE_VIRGIN_DATA.search(data_text)
                 if data_match:
                     data_amount = data_match.group(0)  # e.g., "10GB", "250MB"
-                elif re.search(r'talk\s*and\s*text', data_text, re.I) and not re.search(r'\d+\s*(GB|MB)', data_text, re.I):
+                elif _RE_VIRGIN_TALK_AND_TEXT.search(data_text) and not _RE_VIRGIN_DATA.search(data_text):
                     data_amount = "pay per use"
             
             # If still no data amount, try container text
             if data_amount == "unknown":
-                text = container.get_text()
-                data_match = re.search(r'(\d+)\s*(GB|MB)', text, re.I)
+                if container_text is None:
+                    container_text = container.get_text()
+                data_match = _RE_VIRGIN_DATA.search(container_text)
                 if data_match:
                     data_amount = data_match.group(0)
-                elif re.search(r'pay\s*per\s*use', text, re.I):
+                elif _RE_VIRGIN_PAY_PER_USE.search(container_text):
                     data_amount = "pay per use"
-                elif re.search(r'talk\s*and\s*text', text, re.I) and not re.search(r'\d+\s*(GB|MB)', text, re.I):
+                elif _RE_VIRGIN_TALK_AND_TEXT.search(container_text) and not _RE_VIRGIN_DATA.search(container_text):
                     data_amount = "pay per use"
             
             # Extract plan name - prioritize data description, then headings
@@ -2232,44 +2307,41 @@ class AdvancedHTMLStripper:
             
             # First, try to extract from data description span
             if data_span:
-                data_text = data_span.get_text(strip=True)
-                # Pattern: "10GB data, talk & text" -> "10GB"
-                name_match = re.search(r'(\d+GB|\d+MB)', data_text, re.I)
+                # Pattern: "10GB data, talk & text" -> "10GB" (data_text from above)
+                name_match = _RE_VIRGIN_DATA_NAME.search(data_text)
                 if name_match:
                     plan_name = name_match.group(1)  # e.g., "10GB", "250MB"
-                elif re.search(r'talk\s*and\s*text', data_text, re.I) and not re.search(r'\d+\s*(GB|MB)', data_text, re.I):
+                elif _RE_VIRGIN_TALK_AND_TEXT.search(data_text) and not _RE_VIRGIN_DATA.search(data_text):
                     plan_name = "Talk and Text"
             
             # If no plan name from data span, try headings
             if not plan_name:
-                for h in container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+                for h in AdvancedHTMLStripper._iter_headings(container):
                     text = h.get_text(strip=True)
                     if text and len(text) < 50:
                         # Skip headings that are not plan names
-                        skip_texts = ['Warning', 'Get', 'Affordable', 'Find', 'Data, Talk and Text', 
-                                     'All plans include', 'All plans', 'Plans include', 'New activations only',
-                                     'Internet Members', 'Members only']
-                        if not any(skip.lower() in text.lower() for skip in skip_texts):
+                        if not _RE_VIRGIN_HEADING_SKIP.search(text):
                             plan_name = text
                             break
             
             # If still no plan name, use data amount as plan name
             if not plan_name and data_amount != "unknown":
-                if data_amount in ["pay per use", "talk and text only"]:
+                if data_amount in _VIRGIN_TALK_TEXT_AMOUNTS:
                     plan_name = "Talk and Text"
                 else:
                     plan_name = data_amount  # e.g., "10GB", "250MB"
             
             # Last resort: try to extract from container text
             if not plan_name:
-                text = container.get_text()
+                if container_text is None:
+                    container_text = container.get_text()
                 # Look for patterns like "10GB data, talk & text"
-                name_match = re.search(r'(\d+GB)\s+data[,\s]+talk\s*[&,]\s*text', text, re.I)
+                name_match = _RE_VIRGIN_DATA_TALK_TEXT_NAME.search(container_text)
                 if name_match:
                     plan_name = name_match.group(1)  # e.g., "10GB"
-                elif re.search(r'^talk\s*and\s*text', text[:100], re.I):
+                elif _RE_VIRGIN_LEADING_TALK_AND_TEXT.search(container_text[:100]):
                     plan_name = "Talk and Text"
-                elif re.search(r'\bbasic\b', text[:100], re.I):
+                elif _RE_VIRGIN_BASIC.search(container_text[:100]):
                     plan_name = "Basic"
             
             # Skip if plan name is still invalid or price is unknown
@@ -2277,22 +2349,16 @@ class AdvancedHTMLStripper:
                 continue
             
             # Create deduplication key using price and data (most reliable)
-            key = f"{price}|{data_amount}"
+            key = (price, data_amount)
             
             # Also check plan name for additional uniqueness
-            if key in seen_keys:
-                # Check if it's the same plan or a different one
-                existing = seen_keys[key]
-                if existing['name'] != plan_name:
-                    # Different plan with same price/data - use name in key
-                    key = f"{plan_name}|{price}|{data_amount}"
+            existing_name = seen_names.get(key)
+            if existing_name is not None and existing_name != plan_name:
+                # Different plan with same price/data - use name in key
+                key = (plan_name, price, data_amount)
             
-            if key not in seen_keys:
-                seen_keys[key] = {
-                    'name': plan_name,
-                    'price': price,
-                    'data': data_amount
-                }
+            if key not in seen_names:
+                seen_names[key] = plan_name
                 unique_plans.append({
                     'container': container,
                     'name': plan_name,
@@ -2303,135 +2369,44 @@ class AdvancedHTMLStripper:
         return unique_plans
     
     @staticmethod
-    def _normalize_virgin_plan(container) -> Optional[Dict[str, Any]]:
-        """Normalize a single Virgin plan container"""
-        # Extract price from accss-monthlyPrice element (most reliable)
-        price = "unknown"
-        price_elem = container.find(id=re.compile(r'accss-monthlyPrice-', re.I))
-        if price_elem:
-            price_text = price_elem.get_text(strip=True)
-            price_match = re.search(r'\$(\d+(?:\.\d+)?)', price_text)
-            if price_match:
-                price = f"${price_match.group(1)}"
+    def _normalize_virgin_plan(plan_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Normalize a single Virgin plan from its deduplication record
         
-        # If no price from ID, try to find it in the container text
-        if price == "unknown":
-            text = container.get_text()
-            price_match = re.search(r'\$(\d+(?:\.\d+)?)\s*(?:/|per)\s*mo', text, re.I)
-            if price_match:
-                price = f"${price_match.group(1)}"
-            else:
-                price_match = re.search(r'\$\d+(?:\.\d+)?', text)
-                price = price_match.group(0) if price_match else "unknown"
-        
-        # Extract data amount from plan.planFeatures.RP_DATA.Desc span (most reliable)
-        data_amount = "unknown"
-        data_span = container.find('span', class_=re.compile(r'planFeatures|RP_DATA', re.I))
-        if not data_span:
-            # Try finding span with data description
-            for span in container.find_all('span'):
-                span_text = span.get_text(strip=True)
-                if re.search(r'\d+\s*(GB|MB)', span_text, re.I) or 'talk' in span_text.lower():
-                    data_span = span
-                    break
-        
-        if data_span:
-            data_text = data_span.get_text(strip=True)
-            # Look for patterns like "10GB data, talk & text", "40GB data, talk & text", "Talk and text", "250MB data, talk & text"
-            data_match = re.search(r'(\d+)\s*(GB|MB)', data_text, re.I)
-            if data_match:
-                data_amount = data_match.group(0)  # e.g., "10GB", "250MB"
-            elif re.search(r'talk\s*and\s*text', data_text, re.I) and not re.search(r'\d+\s*(GB|MB)', data_text, re.I):
-                data_amount = "pay per use"
-        
-        # If still no data amount, try container text
-        if data_amount == "unknown":
-            text = container.get_text()
-            data_match = re.search(r'(\d+)\s*(GB|MB)', text, re.I)
-            if data_match:
-                data_amount = data_match.group(0)
-            elif re.search(r'pay\s*per\s*use', text, re.I):
-                data_amount = "pay per use"
-            elif re.search(r'talk\s*and\s*text', text, re.I) and not re.search(r'\d+\s*(GB|MB)', text, re.I):
-                data_amount = "pay per use"
-        
-        # Extract plan name - prioritize data description, then headings
-        plan_name = None
-        
-        # First, try to extract from data description span
-        if data_span:
-            data_text = data_span.get_text(strip=True)
-            # Pattern: "10GB data, talk & text" -> "10GB"
-            name_match = re.search(r'(\d+GB|\d+MB)', data_text, re.I)
-            if name_match:
-                plan_name = name_match.group(1)  # e.g., "10GB", "250MB"
-            elif re.search(r'talk\s*and\s*text', data_text, re.I) and not re.search(r'\d+\s*(GB|MB)', data_text, re.I):
-                plan_name = "Talk and Text"
-        
-        # If no plan name from data span, try headings
-        if not plan_name:
-            for h in container.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-                text = h.get_text(strip=True)
-                if text and len(text) < 50:
-                    skip_texts = ['Warning', 'Get', 'Affordable', 'Find', 'Data, Talk and Text',
-                                 'All plans include', 'All plans', 'Plans include', 'New activations only',
-                                 'Internet Members', 'Members only']
-                    if not any(skip.lower() in text.lower() for skip in skip_texts):
-                        plan_name = text
-                        break
-        
-        # If still no plan name, use data amount as plan name
-        if not plan_name and data_amount != "unknown":
-            if data_amount in ["pay per use", "talk and text only"]:
-                plan_name = "Talk and Text"
-            else:
-                plan_name = data_amount  # e.g., "10GB", "250MB"
-        
-        # Last resort: try to extract from container text
-        if not plan_name:
-            text = container.get_text()
-            # Look for patterns like "10GB data, talk & text"
-            name_match = re.search(r'(\d+GB)\s+data[,\s]+talk\s*[&,]\s*text', text, re.I)
-            if name_match:
-                plan_name = name_match.group(1)  # e.g., "10GB"
-            elif re.search(r'^talk\s*and\s*text', text[:100], re.I):
-                plan_name = "Talk and Text"
-            elif re.search(r'\bbasic\b', text[:100], re.I):
-                plan_name = "Basic"
-        
-        # Skip if plan name is still invalid or price is unknown
-        if not plan_name or plan_name == "Unknown" or len(plan_name) > 50 or price == "unknown":
-            return None
+        Name, price and data amount were already extracted by _deduplicate_virgin_plans
+        """
+        container = plan_data['container']
+        plan_name = plan_data['name']
+        price = plan_data['price']
+        data_amount = plan_data['data']
         
         # Extract features - clean up whitespace and noise
         features = []
         for ul in container.find_all('ul'):
             for li in ul.find_all('li'):
-                for sup in li.find_all('sup'):
-                    sup.decompose()
-                
-                # Use get_text with separator to properly handle nested content
-                # separator=' ' ensures all text nodes are joined with single spaces
-                text = li.get_text(separator=' ', strip=True)
+                if li.find_parent('sup') is not None:
+                    # List item inside a footnote
+                    continue
+                # Text without <sup> footnotes, all text nodes joined with single spaces
+                text = AdvancedHTMLStripper._text_without_sup(li, ' ', strip=True)
                 
                 # Remove excessive whitespace (multiple spaces/newlines/tabs)
-                text = re.sub(r'\s+', ' ', text).strip()
+                text = _RE_WS.sub(' ', text).strip()
                 
                 # Skip if too short, contains price info (already in price field), or is just whitespace
                 if text and len(text) > 5:
                     # Skip if it's just a price (e.g., "$45/mo")
-                    if not re.match(r'^\$?\d+.*mo', text, re.I):
+                    if not _RE_VIRGIN_PRICE_FEATURE.match(text):
                         # Skip promotional text
-                        skip_patterns = ['new activations only', 'tooltip', 'view rates', 'suspicious call detection']
-                        if not any(skip in text.lower() for skip in skip_patterns):
+                        lowered = text.lower()
+                        if not any(skip in lowered for skip in _VIRGIN_FEATURE_SKIP_TEXTS):
                             # If the text contains multiple sentences/phrases separated by significant whitespace,
                             # split them into separate features
                             # Look for patterns like "Feature A    Feature B" (3+ spaces) or common separators
-                            parts = re.split(r'\s{3,}|\.\s+(?=[A-Z])', text)  # Split on 3+ spaces or sentence boundaries
+                            parts = _RE_VIRGIN_FEATURE_SPLIT.split(text)
                             for part in parts:
                                 part = part.strip()
                                 # Clean up any remaining whitespace
-                                part = re.sub(r'\s+', ' ', part).strip()
+                                part = _RE_WS.sub(' ', part).strip()
                                 if part and len(part) > 5 and part not in features:
                                     features.append(part)
             if features:
@@ -2439,21 +2414,15 @@ class AdvancedHTMLStripper:
         
         # Fallback: look for feature-like text patterns (only if no features found)
         if not features:
-            text = container.get_text(separator=' ', strip=True)
+            text = AdvancedHTMLStripper._text_without_sup(container, ' ', strip=True)
             # Clean up whitespace
-            text = re.sub(r'\s+', ' ', text)
+            text = _RE_WS.sub(' ', text)
             # Look for common feature patterns
-            feature_patterns = [
-                r'Unlimited\s+[^.]*?',
-                r'\d+\s*GB[^.]*?',
-                r'Canada-wide[^.]*?',
-                r'Text[^.]*?'
-            ]
-            for pattern in feature_patterns:
-                matches = re.findall(pattern, text, re.I)
+            for pattern in _VIRGIN_FEATURE_PATTERNS:
+                matches = pattern.findall(text)
                 for m in matches:
                     cleaned = m.strip()
-                    if len(cleaned) > 5 and not re.match(r'^\$?\d+', cleaned):
+                    if len(cleaned) > 5 and not _RE_LEADING_AMOUNT.match(cleaned):
                         features.append(cleaned)
         
         # Limit features to top 10 most relevant
@@ -2466,3 +2435,39 @@ class AdvancedHTMLStripper:
             'features': features
         }
 
+
+# Carrier tag -> stripper, for batch stripping
+_STRIPPERS: Dict[str, Callable[[str], Dict[str, Any]]] = {
+    'rogers': AdvancedHTMLStripper.strip_rogers_html,
+    'telus': AdvancedHTMLStripper.strip_telus_html,
+    'bell': AdvancedHTMLStripper.strip_bell_html,
+    'freedom': AdvancedHTMLStripper.strip_freedom_html,
+    'koodo': AdvancedHTMLStripper.strip_koodo_html,
+    'fido': AdvancedHTMLStripper.strip_fido_html,
+    'virgin': AdvancedHTMLStripper.strip_virgin_html,
+}
+
+
+def _strip_page(page: Tuple[str, str]) -> Dict[str, Any]:
+    """Strip one (carrier, html_content) pair - process pool worker"""
+    carrier, html_content = page
+    return _STRIPPERS[carrier.lower()](html_content)
+
+
+def strip_many(pages: List[Tuple[str, str]], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Strip several (carrier, html_content) pages in parallel, one process per CPU core
+    Results are returned in input order
+    """
+    pages = list(pages)
+    for carrier, _ in pages:
+        if carrier.lower() not in _STRIPPERS:
+            raise ValueError(f"No advanced stripper for carrier: {carrier}")
+    
+    # A single page isn't worth the process start-up cost
+    if len(pages) <= 1:
+        return [_strip_page(page) for page in pages]
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(pages))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_strip_page, pages))
@@ -4,8 +4,9 @@ Streamlit Cloud Entry Point
 This file is the main entry point for Streamlit Cloud deployment.
 It imports and runs the unified dashboard.
 """
-from apps.unified_dashboard import main
 
 if __name__ == "__main__":
+    # Imported here so loading this module alone stays cheap; `streamlit run` executes it as __main__
+    from apps.unified_dashboard import main
     main()
 